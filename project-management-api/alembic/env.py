@@ -15,6 +15,7 @@ from app.models.project import Project
 from app.models.task import Task
 from app.models.user import User
 from app.models.session import Session
+from app.models.token_revocation import TokenRevocation
 
 settings = get_settings()
 
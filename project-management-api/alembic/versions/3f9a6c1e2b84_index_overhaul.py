@@ -0,0 +1,125 @@
+"""Index overhaul: drop duplicate id uniques, add query-shaped indexes
+
+Revision ID: 3f9a6c1e2b84
+Revises: 8c3f4a2e6d17
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a6c1e2b84'
+down_revision: Union[str, Sequence[str], None] = '8c3f4a2e6d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# UniqueConstraint('id') from the init migration, duplicating each primary key
+DUPLICATE_UNIQUES = {
+    'users': 'users_id_key',
+    'projects': 'projects_id_key',
+    'tasks': 'tasks_id_key',
+}
+
+# (name, table, columns) - btree scans backwards, so these also serve
+# the "ORDER BY created_at DESC" of every list endpoint
+INDEXES = [
+    # TaskService.list_tasks (project filter / manager scope), list_project_tasks, get_task_board
+    ('ix_tasks_project_id_created_at', 'tasks', 'project_id, created_at'),
+    # list_tasks for developers / assigned_to filter
+    ('ix_tasks_assigned_to_created_at', 'tasks', 'assigned_to, created_at'),
+    # Developer project scope (subquery) and ensure_project_access
+    ('ix_tasks_assigned_to_project_id', 'tasks', 'assigned_to, project_id'),
+    # list_tasks status filter, dashboard status counts
+    ('ix_tasks_status_created_at', 'tasks', 'status, created_at'),
+    # Unfiltered admin listing
+    ('ix_tasks_created_at', 'tasks', 'created_at'),
+    # ProjectService.list_projects for managers
+    ('ix_projects_owner_id_created_at', 'projects', 'owner_id, created_at'),
+    # Unfiltered admin listing / date range
+    ('ix_projects_created_at', 'projects', 'created_at'),
+]
+
+# SessionService.list_sessions default (active only, newest first).
+# sessions is partitioned: build on each partition CONCURRENTLY, then attach.
+SESSIONS_ACTIVE_INDEX = 'ix_sessions_active_created_at'
+
+
+def _partitions(conn, parent: str) -> list[str]:
+    return list(conn.execute(sa.text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = CAST(:parent AS regclass)
+    """), {"parent": parent}).scalars())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    op.execute("SET lock_timeout = '5s'")
+
+    # Foreign keys may have bound to the duplicate unique index instead of the
+    # primary key; re-point them before dropping it.
+    for table, constraint in DUPLICATE_UNIQUES.items():
+        dependents = conn.execute(sa.text("""
+            SELECT fk.conname, fk.conrelid::regclass::text AS tbl,
+                   pg_get_constraintdef(fk.oid) AS definition,
+                   c.relkind = 'p' AS partitioned
+            FROM pg_constraint fk
+            JOIN pg_constraint uq ON uq.conindid = fk.conindid
+            JOIN pg_class c ON c.oid = fk.conrelid
+            WHERE uq.conname = :constraint
+              AND uq.conrelid = CAST(:table AS regclass)
+              AND fk.contype = 'f'
+              AND fk.conparentid = 0
+        """), {"constraint": constraint, "table": table}).all()
+
+        for fk in dependents:
+            op.execute(f'ALTER TABLE {fk.tbl} DROP CONSTRAINT "{fk.conname}"')
+
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS "{constraint}"')
+
+        for fk in dependents:
+            # NOT VALID + VALIDATE avoids holding the strong lock for the scan
+            # (not available on partitioned tables)
+            suffix = "" if fk.partitioned else " NOT VALID"
+            op.execute(f'ALTER TABLE {fk.tbl} ADD CONSTRAINT "{fk.conname}" {fk.definition}{suffix}')
+            if not fk.partitioned:
+                op.execute(f'ALTER TABLE {fk.tbl} VALIDATE CONSTRAINT "{fk.conname}"')
+
+    partitions = _partitions(conn, 'sessions')
+
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Concurrent builds wait out long transactions instead of failing fast
+        op.execute("RESET lock_timeout")
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {SESSIONS_ACTIVE_INDEX} ON ONLY sessions (created_at) WHERE is_active"
+        )
+        for partition in partitions:
+            child = f"{partition}_active_created_at_idx"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} (created_at) WHERE is_active"
+            )
+            op.execute(f"ALTER INDEX {SESSIONS_ACTIVE_INDEX} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX IF EXISTS {SESSIONS_ACTIVE_INDEX}")
+
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+        for table, constraint in DUPLICATE_UNIQUES.items():
+            op.execute(f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {constraint} ON {table} (id)")
+            op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE USING INDEX {constraint}")
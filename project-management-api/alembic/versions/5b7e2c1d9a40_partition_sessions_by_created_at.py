@@ -0,0 +1,109 @@
+"""Partition sessions by created_at
+
+Revision ID: 5b7e2c1d9a40
+Revises: 099cd4d52b0a
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c1d9a40'
+down_revision: Union[str, Sequence[str], None] = '099cd4d52b0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Monthly partitions are created this far ahead (the reaper keeps it topped up)
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, refresh_token_hash, device_name, device_os, user_agent, "
+    "ip_address, is_active, created_at, last_used_at, refresh_token_expires_at"
+)
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    op.execute("ALTER TABLE sessions RENAME TO sessions_legacy")
+    op.execute("ALTER TABLE sessions_legacy RENAME CONSTRAINT sessions_pkey TO sessions_legacy_pkey")
+
+    # The partition key must be part of the primary key, so created_at
+    # becomes NOT NULL and the PK becomes (id, created_at).
+    op.execute("""
+        CREATE TABLE sessions (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            refresh_token_hash VARCHAR(255) NOT NULL,
+            device_name VARCHAR(255),
+            device_os VARCHAR(255),
+            user_agent VARCHAR(1024),
+            ip_address VARCHAR(255),
+            is_active BOOLEAN,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            last_used_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            refresh_token_expires_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE sessions_default PARTITION OF sessions DEFAULT")
+
+    oldest = conn.execute(
+        sa.text("SELECT min(created_at)::date FROM sessions_legacy")
+    ).scalar()
+
+    this_month = date.today().replace(day=1)
+    month = (oldest or this_month).replace(day=1)
+    last = _add_months(this_month, MONTHS_AHEAD)
+
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE sessions_p{month:%Y%m} PARTITION OF sessions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+
+    op.execute(f"""
+        INSERT INTO sessions ({COLUMNS})
+        SELECT id, user_id, refresh_token_hash, device_name, device_os, user_agent,
+               ip_address, is_active, coalesce(created_at, now()), last_used_at,
+               refresh_token_expires_at
+        FROM sessions_legacy
+    """)
+    op.execute("DROP TABLE sessions_legacy")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE sessions RENAME TO sessions_partitioned")
+    op.create_table('sessions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('refresh_token_hash', sa.String(length=255), nullable=False),
+    sa.Column('device_name', sa.String(length=255), nullable=True),
+    sa.Column('device_os', sa.String(length=255), nullable=True),
+    sa.Column('user_agent', sa.String(length=1024), nullable=True),
+    sa.Column('ip_address', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_used_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('refresh_token_expires_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='sessions_plain_pkey')
+    )
+    op.execute(f"INSERT INTO sessions ({COLUMNS}) SELECT {COLUMNS} FROM sessions_partitioned")
+    op.execute("DROP TABLE sessions_partitioned")
+    op.execute("ALTER TABLE sessions RENAME CONSTRAINT sessions_plain_pkey TO sessions_pkey")
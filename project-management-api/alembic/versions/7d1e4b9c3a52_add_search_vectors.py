@@ -0,0 +1,76 @@
+"""Add generated search_vector columns, GIN indexes and optional trigram indexes
+
+Revision ID: 7d1e4b9c3a52
+Revises: 3f9a6c1e2b84
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d1e4b9c3a52'
+down_revision: Union[str, Sequence[str], None] = '3f9a6c1e2b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (title-like column, body column); config must match app/utils/search.py
+SEARCHABLE = {
+    'tasks': ('title', 'description'),
+    'projects': ('name', 'description'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a STORED generated column rewrites the table (ACCESS EXCLUSIVE)
+    for table, (title, body) in SEARCHABLE.items():
+        op.add_column(table, sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                f"setweight(to_tsvector('english', coalesce({title}, '')), 'A') || "
+                f"setweight(to_tsvector('english', coalesce({body}, '')), 'B')",
+                persisted=True,
+            ),
+        ))
+
+    with op.get_context().autocommit_block():
+        for table in SEARCHABLE:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector "
+                f"ON {table} USING gin (search_vector)"
+            )
+
+        # SEARCH_MODE=trigram: needs pg_trgm, which may not be installable here
+        try:
+            op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except Exception as exc:
+            logger.warning("pg_trgm unavailable, skipping trigram indexes: %s", exc)
+            return
+
+        for table, (title, body) in SEARCHABLE.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_trgm ON {table} "
+                f"USING gin (lower({title}) gin_trgm_ops, lower({body}) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in SEARCHABLE:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_trgm")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_vector")
+
+    for table in SEARCHABLE:
+        op.drop_column(table, 'search_vector')
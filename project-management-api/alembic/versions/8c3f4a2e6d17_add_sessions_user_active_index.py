@@ -0,0 +1,33 @@
+"""Add sessions (user_id, is_active, created_at) index
+
+Revision ID: 8c3f4a2e6d17
+Revises: 5b7e2c1d9a40
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f4a2e6d17'
+down_revision: Union[str, Sequence[str], None] = '5b7e2c1d9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backs /auth/sessions and the per-user active session cap.
+    # (Created on the partitioned parent, so it cascades to every partition.)
+    op.create_index(
+        'ix_sessions_user_id_is_active_created_at',
+        'sessions',
+        ['user_id', 'is_active', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_user_id_is_active_created_at', table_name='sessions')
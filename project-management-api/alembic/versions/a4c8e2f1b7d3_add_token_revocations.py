@@ -0,0 +1,39 @@
+"""Add token_revocations (shared stateless-token revocation epochs)
+
+Revision ID: a4c8e2f1b7d3
+Revises: 7d1e4b9c3a52
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f1b7d3'
+down_revision: Union[str, Sequence[str], None] = '7d1e4b9c3a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'token_revocations',
+        sa.Column('kind', sa.String(length=16), nullable=False),
+        sa.Column('subject_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('epoch_ms', sa.BigInteger(), nullable=False),
+        sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('kind', 'subject_id'),
+    )
+    # Startup load and reaper cleanup both filter on expires_at
+    op.create_index('ix_token_revocations_expires_at', 'token_revocations', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_token_revocations_expires_at', table_name='token_revocations')
+    op.drop_table('token_revocations')
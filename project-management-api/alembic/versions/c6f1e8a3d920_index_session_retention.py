@@ -0,0 +1,93 @@
+"""Index session retention predicates, drop an empty sessions_default
+
+Revision ID: c6f1e8a3d920
+Revises: a4c8e2f1b7d3
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1e8a3d920'
+down_revision: Union[str, Sequence[str], None] = 'a4c8e2f1b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, child suffix, definition) - SessionReaper._delete_batches walks one
+# of these per pass instead of rescanning sessions for every batch
+INDEXES = [
+    ('ix_sessions_refresh_token_expires_at', 'refresh_token_expires_at_idx',
+     '(refresh_token_expires_at)'),
+    ('ix_sessions_inactive_last_seen', 'inactive_last_seen_idx',
+     '(coalesce(last_used_at, created_at)) WHERE is_active IS NOT TRUE'),
+]
+
+
+# Without a DEFAULT partition every insert needs its month's partition: this
+# month and the next always exist after this migration, and app startup
+# tops them up (SessionReaper.ensure_partitions) even with the reaper off
+MONTHS_AHEAD = 1
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+
+def _partitions(conn, parent: str) -> list[str]:
+    return list(conn.execute(sa.text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = CAST(:parent AS regclass)
+    """), {"parent": parent}).scalars())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    # DETACH PARTITION CONCURRENTLY is refused while a DEFAULT partition
+    # exists. The reaper keeps monthly partitions ahead of now(), so only
+    # out-of-range rows ever landed there; keep it if any did.
+    has_default = conn.execute(sa.text("SELECT to_regclass('sessions_default') IS NOT NULL")).scalar()
+    if has_default and not conn.execute(sa.text("SELECT EXISTS (SELECT 1 FROM sessions_default)")).scalar():
+        op.execute("SET lock_timeout = '5s'")
+        op.execute("ALTER TABLE sessions DETACH PARTITION sessions_default")
+        op.execute("DROP TABLE sessions_default")
+
+        month = date.today().replace(day=1)
+        for _ in range(MONTHS_AHEAD + 1):
+            upper = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS sessions_p{month:%Y%m} PARTITION OF sessions "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            month = upper
+
+    partitions = _partitions(conn, 'sessions')
+
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute("RESET lock_timeout")
+        for name, suffix, definition in INDEXES:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY sessions {definition}")
+            for partition in partitions:
+                child = f"{partition}_{suffix}"
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {definition}")
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute("CREATE TABLE IF NOT EXISTS sessions_default PARTITION OF sessions DEFAULT")
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import os
 
@@ -13,6 +14,108 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     ADMIN_INVITE_CODE: str = "default-invite"
 
+    # Database engine / connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 = never
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: str = "off"  # "off" | "on" | "debug" (also logs result rows)
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection
+    # SQLAlchemy's own per-connection prepared-statement LRU (what the asyncpg
+    # dialect actually executes through) and the engine's compiled-SQL cache
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    DB_QUERY_CACHE_SIZE: int = 1000
+    # PgBouncer transaction pooling: no cached prepared statements and unique
+    # statement names. The invalidation bus (LISTEN) and the reaper's advisory
+    # lock still need a session-pooled / direct DSN.
+    DB_PGBOUNCER_COMPAT: bool = False
+
+    # Statement timeout (ms, 0 = server default) for every pooled connection,
+    # and per-route / per-router overrides applied with SET LOCAL, keyed by
+    # "METHOD /path/template" or a bare path prefix (longest prefix wins)
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_ROUTE_STATEMENT_TIMEOUTS: Dict[str, int] = {
+        "GET /api/v1/tasks": 5000,
+        "GET /api/v1/projects": 5000,
+        "GET /api/v1/users": 5000,
+        "GET /api/v1/sessions": 5000,
+        "/api/v1/stats": 10000,
+    }
+
+    # Per-request query budget (count and total query ms, 0 = unlimited):
+    # "log" records the route + SQL, "cancel" also fails the request with 503
+    DB_QUERY_BUDGET_COUNT: int = 30
+    DB_QUERY_BUDGET_MS: float = 2000
+    DB_QUERY_BUDGET_ACTION: str = "log"
+
+    # Optional read replica for list / summary / stats reads. A user's reads
+    # stay on the primary for this long after they commit a write.
+    READ_DATABASE_URL: Optional[str] = None
+    READ_AFTER_WRITE_PIN_SECONDS: float = 5.0
+
+    # `search` on task / project lists: "fts" (ranked full-text with snippets),
+    # "trigram" (substring via pg_trgm) or "like" (unindexed LIKE)
+    SEARCH_MODE: str = "fts"
+
+    # count=estimated on list endpoints: filtered counts stop here ("10,000+")
+    COUNT_ESTIMATE_CAP: int = 10000
+
+    # JWT signing keys by "kid" (JSON object in the env). HS*: shared secrets;
+    # RS*/ES*: public keys, with JWT_PRIVATE_KEY set only where tokens are issued.
+    # SECRET_KEY is always accepted as kid "default" in HS* mode.
+    JWT_KEYS: Dict[str, str] = {}
+    JWT_ACTIVE_KID: str = "default"
+    JWT_PRIVATE_KEY: Optional[str] = None
+    JWT_VERIFY_CACHE_SIZE: int = 10000
+
+    # Refresh tokens: keyed digest ("hmac-sha256") or legacy "bcrypt"
+    REFRESH_TOKEN_HASH_SCHEME: str = "hmac-sha256"
+    REFRESH_TOKEN_PEPPER: Optional[str] = None  # defaults to SECRET_KEY
+
+    # Auth principal cache (session_id -> user); set TTL to 0 to disable
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # "session": timeless access tokens checked against the sessions table
+    # "stateless": short-lived tokens carrying role/is_active/issue time;
+    #              safe-method requests authenticate without a DB lookup
+    ACCESS_TOKEN_MODE: str = "session"
+
+    # Cross-worker cache invalidation over Postgres LISTEN/NOTIFY
+    INVALIDATION_BUS_ENABLED: bool = False
+    INVALIDATION_BUS_CHANNEL: str = "cache_invalidation"
+
+    # Write-behind Session.last_used_at tracking
+    SESSION_ACTIVITY_FLUSH_SECONDS: float = 10.0
+    SESSION_ACTIVITY_MAX_PENDING: int = 50000
+
+    # Max concurrently active sessions per user (LRU evicted on login); 0 = unlimited
+    MAX_ACTIVE_SESSIONS_PER_USER: int = 20
+
+    # Sessions retention (partition upkeep + batched deletes)
+    SESSION_REAPER_ENABLED: bool = True
+    SESSION_REAPER_INTERVAL_SECONDS: float = 3600
+    SESSION_REAPER_BATCH_SIZE: int = 5000
+    SESSION_RETENTION_DAYS: int = 30
+    SESSION_PARTITION_RETENTION_MONTHS: int = 3
+
+    # Login throttling (token buckets per client IP and per email)
+    LOGIN_RATE_PER_IP_PER_MINUTE: float = 30
+    LOGIN_BURST_PER_IP: int = 10
+    LOGIN_RATE_PER_EMAIL_PER_MINUTE: float = 10
+    LOGIN_BURST_PER_EMAIL: int = 5
+    LOGIN_THROTTLE_MAX_KEYS: int = 100000
+
+    # Reverse proxies in front of the app that append to X-Forwarded-For;
+    # 0 = use the socket peer address and ignore the header
+    TRUSTED_PROXY_COUNT: int = 0
+
+    # Password hashing pool ("thread" or "process")
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
     model_config = {
         "env_file": ".env",
         "extra": "ignore",
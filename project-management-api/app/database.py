@@ -1,14 +1,56 @@
 # app/database.py
 
+import time
+from threading import Lock
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.config import get_settings
+from app.utils.invalidation_bus import invalidation_bus
+from app.utils.query_budget import query_budgets
 
 settings = get_settings()
 
 DATABASE_URL = settings.DATABASE_URL.replace("postgresql+psycopg2", "postgresql+asyncpg")
 
-engine = create_async_engine(DATABASE_URL, future=True, echo=True)
+ECHO_LEVELS = {"off": False, "on": True, "debug": "debug"}
+
+
+def build_engine(url: str):
+    """Async engine with pool / echo / asyncpg statement-cache settings from Settings."""
+    connect_args = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_PGBOUNCER_COMPAT:
+        # Server-side prepared statements don't survive transaction pooling:
+        # never reuse them, and give each one a name no other client can clash with
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    connect_args.update(query_budgets.connect_args())
+
+    return create_async_engine(
+        url,
+        future=True,
+        echo=ECHO_LEVELS.get(settings.DB_ECHO.lower(), False),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=connect_args,
+    )
+
+
+engine = build_engine(DATABASE_URL)
+query_budgets.instrument(engine)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -18,8 +60,188 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica; without one, reads simply use the primary
+read_engine = (
+    build_engine(settings.READ_DATABASE_URL.replace("postgresql+psycopg2", "postgresql+asyncpg"))
+    if settings.READ_DATABASE_URL
+    else engine
+)
+if read_engine is not engine:
+    query_budgets.instrument(read_engine)
+
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
-async def get_db():
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
+        session.info["query_budget"] = query_budgets.for_request(request)
+        yield session
+
+
+# ---------------------------------------------------------
+# READ ROUTING (read-your-writes)
+# ---------------------------------------------------------
+class RecentWrites:
+    """
+    user_id -> time until which that user's reads stay on the primary.
+
+    Marked when a request session bound to the user (see `bind_user`)
+    commits a write; other workers learn about it over the invalidation bus.
+    """
+
+    def __init__(self, pin_seconds: float = 5.0, max_entries: int = 100000):
+        self.pin_seconds = pin_seconds
+        self.max_entries = max_entries
+        self._until: dict[str, float] = {}
+        self._lock = Lock()
+
+        self.replica_reads = 0
+        self.pinned_reads = 0
+        self.anonymous_reads = 0
+
+    def mark(self, user_id, generation: int | None = None):
+        if not self.pin_seconds:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) >= self.max_entries:
+                self._until = {k: v for k, v in self._until.items() if v > now}
+            self._until[str(user_id)] = now + self.pin_seconds
+
+    def is_pinned(self, user_id) -> bool:
+        until = self._until.get(str(user_id))
+        return until is not None and until > time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "replica": read_engine is not engine,
+            "pinned_users": sum(1 for v in list(self._until.values()) if v > time.monotonic()),
+            "replica_reads": self.replica_reads,
+            "pinned_reads": self.pinned_reads,
+            "anonymous_reads": self.anonymous_reads,
+        }
+
+
+recent_writes = RecentWrites(pin_seconds=settings.READ_AFTER_WRITE_PIN_SECONDS)
+
+
+def bind_user(request: Request, db: AsyncSession, user_id):
+    """Called by the auth dependency: lets writes pin, and reads route, per user."""
+    request.state.user_id = str(user_id)
+    db.info["user_id"] = str(user_id)
+
+
+async def get_read_db(request: Request):
+    """
+    Session for read-only GET routes: the replica, unless the user committed a
+    write in the last READ_AFTER_WRITE_PIN_SECONDS (or is not known yet).
+
+    Must resolve after the auth dependency, e.g. listed in the router's
+    `dependencies=[Depends(get_current_user)]`.
+    """
+    user_id = getattr(request.state, "user_id", None)
+
+    if read_engine is engine:
+        factory = AsyncSessionLocal
+    elif user_id is None:
+        recent_writes.anonymous_reads += 1
+        factory = AsyncSessionLocal
+    elif recent_writes.is_pinned(user_id):
+        recent_writes.pinned_reads += 1
+        factory = AsyncSessionLocal
+    else:
+        recent_writes.replica_reads += 1
+        factory = ReadSessionLocal
+
+    async with factory() as session:
+        session.info["query_budget"] = query_budgets.for_request(request)
         yield session
+
+
+# ---------------------------------------------------------
+# STATEMENT TIMEOUTS / QUERY BUDGETS (request sessions only)
+# ---------------------------------------------------------
+@event.listens_for(Session, "after_begin")
+def _apply_query_budget(session, transaction, connection):
+    budget = session.info.get("query_budget")
+    if budget is None:
+        return
+
+    # SET LOCAL lasts until this transaction ends, so it is re-applied per
+    # transaction; detached while it runs so it never counts against the budget
+    connection.info.pop("query_budget", None)
+    if budget.statement_timeout_ms is not None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(budget.statement_timeout_ms)}")
+
+    # Counted by the cursor hooks, dropped again on pool checkin
+    connection.info["query_budget"] = budget
+
+
+# ---------------------------------------------------------
+# POST-COMMIT CALLBACKS
+# ---------------------------------------------------------
+def after_commit(db: AsyncSession, callback):
+    """Run `callback()` once the current transaction commits (dropped on rollback)."""
+    db.sync_session.info.setdefault("after_commit", []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session):
+    for callback in session.info.pop("after_commit", []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(session):
+    session.info.pop("after_commit", None)
+
+
+# ---------------------------------------------------------
+# WRITE TRACKING (for READ ROUTING)
+# ---------------------------------------------------------
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_recent_write(session):
+    if read_engine is engine or not recent_writes.pin_seconds:
+        return
+
+    user_id = session.info.get("user_id")
+    wrote = session.info.get("wrote") or session.new or session.dirty or session.deleted
+    if not (user_id and wrote):
+        return
+
+    session.info["wrote"] = True
+    if invalidation_bus.enabled:
+        # Sync call is fine here: AsyncSession runs commit inside its greenlet
+        session.execute(invalidation_bus.notify_statement("write", user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_recent_write(session):
+    if session.info.pop("wrote", None) and session.info.get("user_id"):
+        recent_writes.mark(session.info["user_id"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_write_flag(session):
+    session.info.pop("wrote", None)
+
+
+invalidation_bus.subscribe("write", recent_writes.mark)
@@ -2,6 +2,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 from fastapi.openapi.utils import get_openapi
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 
 
@@ -26,6 +28,17 @@ from app.utils.error_handler import (
     http_exception_handler,
     global_exception_handler,
 )
+from app.utils.password_hasher import password_hasher
+from app.utils.invalidation_bus import invalidation_bus
+from app.utils.session_activity import session_activity
+from app.utils.session_reaper import session_reaper
+from app.config import get_settings
+import app.utils.revocation as _revocation  # registers invalidation handlers
+from app.utils.revocation import load_revocations
+assert _revocation
+
+
+settings = get_settings()
 
 
 # ---------------------------------------------------------
@@ -63,6 +76,30 @@ def custom_openapi(app: FastAPI):
     return app.openapi_schema
 
 
+# ---------------------------------------------------------
+# LIFESPAN (startup / shutdown of background resources)
+# ---------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.ACCESS_TOKEN_MODE == "stateless":
+        await load_revocations()
+    await session_reaper.ensure_partitions()
+
+    background = [asyncio.create_task(session_activity.run())]
+    if invalidation_bus.enabled:
+        background.append(asyncio.create_task(invalidation_bus.run()))
+    if settings.SESSION_REAPER_ENABLED:
+        background.append(asyncio.create_task(session_reaper.run()))
+
+    yield
+
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hasher.shutdown()
+
+
 # ---------------------------------------------------------
 # APPLICATION FACTORY
 # ---------------------------------------------------------
@@ -70,7 +107,8 @@ def create_app():
     app = FastAPI(
         title="Project Management API",
         version="1.0.0",
-        swagger_ui_parameters={"persistAuthorization": True}  # ⭐ Keep token saved
+        swagger_ui_parameters={"persistAuthorization": True},  # ⭐ Keep token saved
+        lifespan=lifespan,
     )
 
     # CORS
@@ -2,4 +2,5 @@ from .user import User
 from .project import Project
 from .task import Task
 from .session import Session
+from .token_revocation import TokenRevocation
 from .enums import *
\ No newline at end of file
@@ -1,22 +1,28 @@
 # app/models/project.py
 
-import uuid
-from sqlalchemy import Column, String, Text, Enum, TIMESTAMP, ForeignKey, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, String, Text, Enum, TIMESTAMP, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
 from app.models.enums import ProjectStatus
 
 
 class Project(Base):
     __tablename__ = "projects"
 
+    # See migration 3f9a6c1e2b84
+    __table_args__ = (
+        Index("ix_projects_owner_id_created_at", "owner_id", "created_at"),
+        Index("ix_projects_created_at", "created_at"),
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False
     )
 
@@ -46,6 +52,16 @@ class Project(Base):
         onupdate=func.now()
     )
 
+    # Full-text search (see app/utils/search.py); deferred so plain loads skip it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
     # Relationships
     owner = relationship("User", back_populates="projects")
     tasks = relationship("Task", back_populates="project", cascade="all,delete")
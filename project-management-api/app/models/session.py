@@ -1,21 +1,36 @@
 # app/models/session.py
-import uuid
 from sqlalchemy import (
-    Column, String, Boolean, TIMESTAMP, ForeignKey, func
+    Column, String, Boolean, TIMESTAMP, ForeignKey, Index, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class Session(Base):
     __tablename__ = "sessions"
 
+    # Range-partitioned by month (see migration 5b7e2c1d9a40); the database
+    # primary key is (id, created_at), the ORM identity stays `id`.
+    __table_args__ = (
+        Index("ix_sessions_user_id_is_active_created_at", "user_id", "is_active", "created_at"),
+        Index("ix_sessions_active_created_at", "created_at", postgresql_where=text("is_active")),
+        # SessionReaper batches (see migration c6f1e8a3d920)
+        Index("ix_sessions_refresh_token_expires_at", "refresh_token_expires_at"),
+        Index(
+            "ix_sessions_inactive_last_seen",
+            text("coalesce(last_used_at, created_at)"),
+            postgresql_where=text("is_active IS NOT TRUE"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False
     )
 
@@ -36,7 +51,8 @@ class Session(Base):
 
     created_at = Column(
         TIMESTAMP(timezone=True),
-        server_default=func.now()
+        server_default=func.now(),
+        nullable=False
     )
 
     last_used_at = Column(
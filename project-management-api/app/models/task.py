@@ -1,23 +1,33 @@
 # app/models/task.py
-import uuid
 from sqlalchemy import (
-    Column, String, Text, Enum, TIMESTAMP, ForeignKey, Integer, func
+    Column, Computed, String, Text, Enum, TIMESTAMP, ForeignKey, Index, Integer, func
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
 from app.models.enums import TaskStatus, TaskPriority
 
 
 class Task(Base):
     __tablename__ = "tasks"
 
+    # Shaped after list_tasks / list_project_tasks / get_task_board filters
+    # (see migration 3f9a6c1e2b84)
+    __table_args__ = (
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at"),
+        Index("ix_tasks_assigned_to_created_at", "assigned_to", "created_at"),
+        Index("ix_tasks_assigned_to_project_id", "assigned_to", "project_id"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        Index("ix_tasks_created_at", "created_at"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False
     )
 
@@ -60,6 +70,16 @@ class Task(Base):
         onupdate=func.now()
     )
 
+    # Full-text search (see app/utils/search.py); deferred so plain loads skip it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
     # Relationships
     project = relationship("Project", back_populates="tasks")
     creator = relationship("User", foreign_keys=[created_by], back_populates="created_tasks")
@@ -0,0 +1,25 @@
+# app/models/token_revocation.py
+from sqlalchemy import BigInteger, Column, Index, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class TokenRevocation(Base):
+    """
+    Shared revocation epochs for stateless access tokens (see
+    app/utils/revocation.py): tokens of the user / session issued before
+    `epoch_ms` are rejected. Rows are only needed until `expires_at`
+    (epoch + one token lifetime); the session reaper deletes them after.
+    """
+    __tablename__ = "token_revocations"
+
+    __table_args__ = (
+        Index("ix_token_revocations_expires_at", "expires_at"),
+    )
+
+    kind = Column(String(16), primary_key=True)  # "user" | "session"
+    subject_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    epoch_ms = Column(BigInteger, nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
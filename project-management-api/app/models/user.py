@@ -1,11 +1,11 @@
 # app/models/user.py
 
-import uuid
 from sqlalchemy import Column, String, Enum, TIMESTAMP, func, Boolean 
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
 from app.models.enums import UserRole
 
 
@@ -15,8 +15,7 @@ class User(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False
     )
 
@@ -1,25 +1,31 @@
 # app/routers/auth.py
+import time
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
-from jose import jwt
 
-from app.database import get_db
+from app.database import bind_user, get_db
 from app.config import get_settings
 from app.schemas.user import UserPublic, UserRegister # Correct import
+from app.schemas.response import SessionResponse
 from app.services.user_service import UserService
 from app.services.session_service import SessionService
 from app.services.auth_service import AuthService
 from app.models.user import User, UserRole
-from app.models.session import Session
 from app.utils.device import extract_ip, extract_device_info
-from app.utils.response import success  
+from app.utils.records import records_response
+from app.utils.response import success
 from app.utils.auth import hash_password, create_access_token_for_user
+from app.utils.principal_cache import principal_cache
+from app.utils.session_epochs import session_epochs
+from app.utils.tokens import token_verifier
+from app.utils.session_activity import session_activity
+from app.utils.rate_limit import login_throttle
+from app.utils import statements
 
 
 settings = get_settings()
@@ -29,12 +35,10 @@ router = APIRouter(prefix="/api/v1/auth")
 # ============================
 #  AUTH DEPENDENCY (the source of truth)
 # ============================
-async def get_current_user(
-    request: Request,
-    db: AsyncSession = Depends(get_db)
-):
-    """Extract current authenticated user from Bearer token."""
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
 
+
+def _decode_bearer(request: Request) -> dict:
     auth = request.headers.get("Authorization")
 
     if not auth:
@@ -47,36 +51,89 @@ async def get_current_user(
     token = token_parts[1]
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False},  # timeless access token (your design)
-        )
+        # Expiry is not verified here: timeless access token (your design)
+        payload = token_verifier.verify(token)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user_id = payload.get("user_id")
-    session_id = payload.get("session_id")
-
-    if not user_id or not session_id:
+    if not payload.get("user_id") or not payload.get("session_id"):
         raise HTTPException(status_code=401, detail="Token missing user/session ID")
 
+    # Stateless tokens carry their issue time (ms) and DO expire
+    if "iat_ms" in payload and payload.get("exp", 0) < time.time():
+        raise HTTPException(status_code=401, detail="Token expired")
+
+    # In stateless mode every token is held to the revocation epochs; one
+    # without iat_ms counts as issued at 0, i.e. before any revocation
+    if settings.ACCESS_TOKEN_MODE == "stateless" or "iat_ms" in payload:
+        if not session_epochs.accepts(payload["user_id"], payload["session_id"], payload.get("iat_ms", 0)):
+            raise HTTPException(status_code=401, detail="Session is inactive")
+
+    return payload
+
+
+async def _load_session_user(db: AsyncSession, user_id, session_id):
+    # Cache hit → no auth queries at all
+    user = principal_cache.get(session_id)
+    if user is not None and str(user.id) == str(user_id):
+        session_activity.record(session_id)
+        return user
+
     # Validate session
-    result = await db.execute(select(Session).where(Session.id == session_id))
+    result = await db.execute(statements.session_by_id(session_id))
     session = result.scalar_one_or_none()
     if not session or not session.is_active:
         raise HTTPException(status_code=401, detail="Session is inactive")
 
     # Fetch user
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(statements.user_by_id(user_id))
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
+    if str(session.user_id) == str(user.id):
+        principal_cache.put(session_id, user)
+
+    session_activity.record(session_id)
     return user
 
 
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Extract current authenticated user from Bearer token."""
+
+    payload = _decode_bearer(request)
+    bind_user(request, db, payload["user_id"])
+
+    # Stateless token on a read-only request → claims are enough (no DB).
+    # The returned user only carries id / role / is_active.
+    if "iat_ms" in payload and request.method in SAFE_METHODS:
+        if payload.get("is_active") is False:
+            raise HTTPException(status_code=403, detail="Account is disabled. Please contact admin.")
+
+        session_activity.record(payload["session_id"])
+        return User(
+            id=UUID(payload["user_id"]),
+            role=UserRole(payload["role"]),
+            is_active=payload.get("is_active", True),
+        )
+
+    return await _load_session_user(db, payload["user_id"], payload["session_id"])
+
+
+async def get_session_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Like get_current_user, but always returns the full, session-checked user row."""
+
+    payload = _decode_bearer(request)
+    bind_user(request, db, payload["user_id"])
+    return await _load_session_user(db, payload["user_id"], payload["session_id"])
+
+
 # ============================
 #  ROUTER CONFIG
 # ============================
@@ -149,9 +206,13 @@ async def login(
     email = form_data.username
     password = form_data.password
 
-    device = extract_device_info(request)
     ip = extract_ip(request)
 
+    # Reject floods before any SQL or bcrypt work
+    await login_throttle.check(ip=ip, email=email)
+
+    device = extract_device_info(request)
+
     tokens = await UserService.authenticate(
         db=db,
         email=email,
@@ -227,32 +288,23 @@ async def logout_all(
 # LIST ALL SESSIONS OF CURRENT USER
 @router.get("/sessions", response_model=dict)
 async def list_sessions(
+    page: int = 1,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    sessions = await SessionService.list_user_sessions(db, current_user.id)
+    rows, pagination = await SessionService.list_user_sessions(
+        db, current_user.id, page=page, limit=limit, cursor=cursor, count=count
+    )
 
-    return {
-        "message": "Active sessions",
-        "data": [
-            {
-                "id": str(s.id),
-                "device_name": s.device_name,
-                "device_os": s.device_os,
-                "user_agent": s.user_agent,
-                "ip_address": s.ip_address,
-                "is_active": s.is_active,
-                "created_at": s.created_at,
-                "last_used_at": s.last_used_at,
-            }
-            for s in sessions
-        ]
-    }
+    return records_response("Active sessions", rows, SessionResponse, pagination)
 
 
 # GET CURRENT USER PROFILE
 @router.get("/me")
-async def me(current_user: User = Depends(get_current_user)):
+async def me(current_user: User = Depends(get_session_user)):
     return {
         "message": "User profile",
         "data": {
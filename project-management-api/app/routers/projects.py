@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.schemas.response import (
     ProjectPublic, 
@@ -18,6 +18,7 @@ from app.routers.auth import get_current_user
 from app.models.user import User
 from app.models.enums import UserRole
 from app.utils.permissions import require_roles
+from app.utils.records import parse_fields, record_response, records_response
 from app.utils.response import success
 
 
@@ -50,9 +51,16 @@ async def create_project(
 @router.get("/{project_id}", response_model=SuccessResponse)
 async def get_project(
     project_id: UUID,
+    fields: str | None = Query(None, description="Comma-separated subset of fields (sparse fieldset)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    if fields:
+        fieldset = parse_fields(fields, ProjectService.DETAIL_FIELDS, ProjectService.DETAIL_FIELDS)
+        row = await ProjectService.get_project_fields(db, project_id, fieldset)
+        await ProjectService.ensure_project_access(db, row, current_user)
+        return record_response("Project details", row, fieldset)
+
     project = await ProjectService.get_project(db, project_id)
     await ProjectService.ensure_project_access(db, project, current_user)
     
@@ -118,10 +126,15 @@ async def list_projects(
     date_to: datetime | None = Query(None),
     page: int = 1,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    fields: str | None = Query(None, description="Comma-separated subset of fields (sparse fieldset)"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    projects, pagination = await ProjectService.list_projects(
+    fieldset = parse_fields(fields, ProjectService.ALLOWED_LIST_FIELDS, ProjectService.LIST_FIELDS)
+
+    rows, pagination = await ProjectService.list_projects(
         db=db,
         status=status,
         search=search,
@@ -129,13 +142,13 @@ async def list_projects(
         date_to=date_to,
         page=page,
         limit=limit,
-        current_user=current_user
+        current_user=current_user,
+        cursor=cursor,
+        count=count,
+        fields=fieldset,
     )
 
-    return success("Project list", {
-        "data": projects,
-        "pagination": pagination
-    })
+    return records_response("Project list", rows, fieldset, pagination)
 
 
 # -------------------------
@@ -144,7 +157,7 @@ async def list_projects(
 @router.get("/{project_id}/summary", response_model=ProjectSummaryResponse)
 async def get_project_summary(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     project = await ProjectService.get_project(db, project_id)
@@ -6,9 +6,10 @@ from uuid import UUID
 from datetime import datetime
 
 from app.database import get_db
+from app.schemas.response import SessionResponse
 from app.services.session_service import SessionService
 from app.routers.auth import get_current_user
-from app.utils.response import success
+from app.utils.records import records_response
 from app.models.user import User
 from app.models.enums import UserRole
 
@@ -36,6 +37,8 @@ async def list_sessions(
     include_inactive: bool = Query(False),
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = Query(None),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -45,7 +48,7 @@ async def list_sessions(
     - Normal users can see ONLY their own sessions
     """
 
-    sessions, pagination = await SessionService.list_sessions(
+    rows, pagination = await SessionService.list_sessions(
         db=db,
         user_id=current_user.id,
         device_name=device_name,
@@ -56,10 +59,9 @@ async def list_sessions(
         date_to=date_to,
         include_inactive=include_inactive,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor,
+        count=count,
     )
 
-    return success("Session list", {
-        "data": sessions,
-        "pagination": pagination
-    })
+    return records_response("Session list", rows, SessionResponse, pagination)
@@ -3,14 +3,24 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.response import StatsResponse
+from app.database import get_read_db, recent_writes
+from app.schemas.response import StatsResponse, SuccessResponse
 from app.services.stats_service import StatsService
 from app.routers.auth import get_current_user
 from app.models.enums import UserRole
 from app.models.user import User
 from app.utils.permissions import require_roles
 from app.utils.response import success
+from app.utils.invalidation_bus import invalidation_bus
+from app.utils.password_hasher import password_hasher
+from app.utils.principal_cache import principal_cache
+from app.utils.query_budget import query_budgets
+from app.utils.rate_limit import login_throttle
+from app.utils.session_activity import session_activity
+from app.utils.session_epochs import session_epochs
+from app.utils.session_reaper import session_reaper
+from app.utils.statements import compiled_cache_stats
+from app.utils.tokens import token_verifier
 
 
 router = APIRouter(
@@ -25,8 +35,31 @@ router = APIRouter(
 # -------------------------
 @router.get("/", response_model=StatsResponse)
 async def get_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_roles(UserRole.admin))  # 🔐 Only admins allowed
 ):
     stats = await StatsService.get_dashboard_stats(db)
     return success("Dashboard stats", stats)
+
+
+# -------------------------
+# RUNTIME COUNTERS (ADMIN ONLY)
+# -------------------------
+@router.get("/runtime", response_model=SuccessResponse)
+async def get_runtime_stats(
+    current_user: User = Depends(require_roles(UserRole.admin))
+):
+    """In-process caches and background workers of THIS worker."""
+    return success("Runtime stats", {"data": {
+        "principal_cache": principal_cache.stats(),
+        "token_verifier": token_verifier.stats(),
+        "session_epochs": session_epochs.stats(),
+        "password_hasher": password_hasher.stats(),
+        "login_throttle": login_throttle.stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+        "session_activity": session_activity.stats(),
+        "session_reaper": session_reaper.stats(),
+        "compiled_cache": compiled_cache_stats.stats(),
+        "read_routing": recent_writes.stats(),
+        "query_budget": query_budgets.stats(),
+    }})
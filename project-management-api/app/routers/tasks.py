@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.response import TaskBoardResponse, TaskListResponse, SuccessResponse
 from app.schemas.task import (
     TaskCreate,
@@ -18,6 +18,7 @@ from app.routers.auth import get_current_user
 from app.models.user import User
 from app.models.enums import UserRole
 from app.utils.permissions import require_roles
+from app.utils.records import parse_fields, record_response, records_response
 from app.utils.response import success
 
 
@@ -48,7 +49,7 @@ async def create_task(
 @router.get("/project/{project_id}", response_model=TaskListResponse)
 async def list_project_tasks(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     tasks = await TaskService.list_project_tasks(db, project_id, current_user)
@@ -74,10 +75,15 @@ async def list_tasks(
     date_to: datetime | None = Query(None),
     page: int = 1,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    fields: str | None = Query(None, description="Comma-separated subset of fields (sparse fieldset)"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    tasks, pagination = await TaskService.list_tasks(
+    fieldset = parse_fields(fields, TaskService.ALLOWED_LIST_FIELDS, TaskService.LIST_FIELDS)
+
+    rows, pagination = await TaskService.list_tasks(
         db=db,
         project_id=project_id,
         assigned_to=assigned_to,
@@ -88,14 +94,13 @@ async def list_tasks(
         date_to=date_to,
         page=page,
         limit=limit,
-        current_user=current_user
+        current_user=current_user,
+        cursor=cursor,
+        count=count,
+        fields=fieldset,
     )
 
-    return {
-        "message": "Task list",
-        "data": tasks,
-        "pagination": pagination
-    }
+    return records_response("Task list", rows, fieldset, pagination)
 
 # -------------------------
 # GET TASK
@@ -103,9 +108,15 @@ async def list_tasks(
 @router.get("/{task_id}", response_model=SuccessResponse)
 async def get_task(
     task_id: UUID,
+    fields: str | None = Query(None, description="Comma-separated subset of fields (sparse fieldset)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    if fields:
+        fieldset = parse_fields(fields, TaskService.DETAIL_FIELDS, TaskService.DETAIL_FIELDS)
+        row = await TaskService.get_task_fields(db, task_id, fieldset, current_user)
+        return record_response("Task details", row, fieldset)
+
     task = await TaskService.get_task(db, task_id, current_user)
     task_data = TaskPublic.model_validate(task)
     return success("Task details", task_data)
@@ -7,12 +7,14 @@ from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.enums import UserRole
 from app.schemas.response import SuccessResponse, TaskListResponse, UserListResponse, UserResponse
 from app.services.user_service import UserService
 from app.utils.permissions import require_roles
+from app.utils.records import parse_fields, records_response
 from app.utils.response import success
+from app.utils.revocation import revoke_user
 from app.routers.auth import get_current_user
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -35,23 +37,28 @@ async def list_users(
     date_to: datetime | None = Query(None),
     page: int = 1,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
+    fields: str | None = Query(None, description="Comma-separated subset of fields (sparse fieldset)"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_roles(UserRole.admin, UserRole.manager)),
 ):
-    users, pagination = await UserService.list_users(
+    fieldset = parse_fields(fields, UserService.ALLOWED_LIST_FIELDS, UserService.LIST_FIELDS)
+
+    rows, pagination = await UserService.list_users(
         db=db,
         role=role,
         search=search,
         date_from=date_from,
         date_to=date_to,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor,
+        count=count,
+        fields=fieldset,
     )
 
-    return success("User list", {
-        "data": users,
-        "pagination": pagination
-    })
+    return records_response("User list", rows, fieldset, pagination)
 
 
 # -------------------------
@@ -138,6 +145,7 @@ async def delete_user(
 
     user.is_active = False
     db.add(user)
+    await revoke_user(db, user.id)
     await db.commit()
     await db.refresh(user)
 
@@ -180,6 +188,7 @@ async def change_role(
     user.role = payload.role
 
     db.add(user)
+    await revoke_user(db, user.id)
     await db.commit()
     await db.refresh(user)
 
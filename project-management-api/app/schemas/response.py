@@ -38,8 +38,16 @@ class UserListItem(BaseModel):
 class Pagination(BaseModel):
     page: int
     limit: int
-    total: int
-    pages: int
+    # None with count=none; approximate with count=estimated
+    total: Optional[int] = None
+    pages: Optional[int] = None
+    # Keyset cursors: pass back as ?cursor= (stable across inserts)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    count: str = "exact"
+    estimated: bool = False
+    capped: bool = False  # total is a lower bound ("10,000+")
 
 class UserListResponse(BaseModel):
     message: str
@@ -63,6 +71,7 @@ class ProjectListItem(BaseModel):
     name: str
     status: ProjectStatus
     owner_id: UUID 
+    snippet: Optional[str] = None  # HTML-escaped match with <b> highlights, only when searching
     model_config = ConfigDict(from_attributes=True)
 
 class ProjectListResponse(BaseModel):
@@ -117,6 +126,7 @@ class TaskListItem(BaseModel):
     priority: TaskPriority 
     project_id: UUID
     assigned_to: Optional[UUID] = None 
+    snippet: Optional[str] = None  # HTML-escaped match with <b> highlights, only when searching
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -2,19 +2,50 @@
 
 from uuid import uuid4
 from datetime import datetime, timezone, timedelta
+from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.services.session_service import SessionService
 from app.utils.auth import (
     create_access_token,
     hash_refresh_token,
 )
+from app.utils.session_epochs import now_ms
+from app.utils.writes import update_returning
 from app.models.session import Session
+from app.models.user import User
+from app.models.enums import UserRole
+
+
+settings = get_settings()
 
 
 class AuthService:
     REFRESH_TTL_DAYS = 30
 
+    @staticmethod
+    def issue_access_token(user_id, session_id, role=None, is_active: bool = True) -> str:
+        """
+        Session mode: minimal claims, validated against the sessions table.
+        Stateless mode: also embeds role, is_active and the issue time in ms
+        ("iat_ms", checked against revocation epochs) so reads can
+        authenticate without touching the DB.
+        """
+        claims = {
+            "user_id": str(user_id),
+            "session_id": str(session_id),
+        }
+
+        if settings.ACCESS_TOKEN_MODE == "stateless":
+            claims.update({
+                "role": role.value if isinstance(role, UserRole) else str(role),
+                "is_active": bool(is_active),
+                "iat_ms": now_ms(),
+            })
+
+        return create_access_token(claims)
+
     @staticmethod
     async def rotate_refresh_token(db: AsyncSession, session: Session):
         """
@@ -22,20 +53,32 @@ class AuthService:
         - Generate new token
         - Hash + store
         - Extend expiration
+
+        One UPDATE ... RETURNING, conditional on the hash that was just
+        verified: if a concurrent refresh rotated it first, nothing matches
+        and (None, None) is returned.
         """
         new_refresh = str(uuid4())
         new_hash = hash_refresh_token(new_refresh)
 
-        session.refresh_token_hash = new_hash
-        session.refresh_token_expires_at = (
-            datetime.now(timezone.utc) + timedelta(days=AuthService.REFRESH_TTL_DAYS)
+        rotated = await update_returning(
+            db,
+            Session,
+            Session.id == session.id,
+            Session.refresh_token_hash == session.refresh_token_hash,
+            refresh_token_hash=new_hash,
+            refresh_token_expires_at=(
+                datetime.now(timezone.utc) + timedelta(days=AuthService.REFRESH_TTL_DAYS)
+            ),
+            is_active=True,
         )
-        session.is_active = True
+        if rotated is None:
+            await db.rollback()
+            return None, None
 
         await db.commit()
-        await db.refresh(session)
 
-        return new_refresh, session
+        return new_refresh, rotated
 
     @staticmethod
     async def refresh_tokens(db: AsyncSession, session_id: str, refresh_token: str):
@@ -44,19 +87,36 @@ class AuthService:
         1. Validate session & refresh token
         2. Rotate token
         3. Issue new access token
+
+        Stateless mode: a disabled user is refused here, before rotating,
+        or the fresh token's iat_ms would outlive their revocation epoch.
         """
         session = await SessionService.validate_refresh_token(db, session_id, refresh_token)
         if not session:
             return None
 
+        role, is_active = None, True
+        if settings.ACCESS_TOKEN_MODE == "stateless":
+            user = await db.get(User, session.user_id)
+            if not user:
+                return None
+            if user.is_active is False:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Account is disabled. Please contact admin."
+                )
+            role, is_active = user.role, user.is_active
+
         # 1) Rotate refresh
         new_refresh_token, session = await AuthService.rotate_refresh_token(db, session)
+        if not session:
+            return None
 
         # 2) Issue new access token
-        new_access_token = create_access_token({
-            "user_id": str(session.user_id),
-            "session_id": str(session.id)
-        })
+
+        new_access_token = AuthService.issue_access_token(
+            session.user_id, session.id, role=role, is_active=is_active
+        )
 
         return {
             "access_token": new_access_token,
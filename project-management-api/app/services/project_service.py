@@ -1,22 +1,34 @@
 # app/services/project_service.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, func
 from fastapi import HTTPException
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
 
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
-from app.utils.pagination import paginate, build_pagination_metadata
+from app.schemas.response import ProjectListItem, ProjectPublic
+from app.utils.pagination import paginate, build_pagination_metadata, fetch_page
 from app.models.task import Task
 from app.models.enums import UserRole
+from app.utils.writes import insert_returning, update_returning
+from app.utils import statements
+from app.utils.records import entity_columns
+from app.utils.search import build_search
 
 class ProjectService:
+    # ?fields= whitelists (sparse fieldsets, see app/utils/records.py). Lists
+    # default to the list item, which leaves out the unbounded description.
+    DETAIL_FIELDS = tuple(ProjectPublic.model_fields)
+    LIST_FIELDS = tuple(ProjectListItem.model_fields)
+    ALLOWED_LIST_FIELDS = DETAIL_FIELDS + ("snippet",)
 
     # CREATE
     @staticmethod
     async def create_project(db: AsyncSession, data: ProjectCreate, owner_id: UUID):
-        project = Project(
+        project = await insert_returning(
+            db,
+            Project,
             name=data.name,
             description=data.description,
             status=data.status,
@@ -25,40 +37,53 @@ class ProjectService:
             end_date=data.end_date
         )
 
-        db.add(project)
         await db.commit()
-        await db.refresh(project)
         return project
 
     # GET ONE
     @staticmethod
     async def get_project(db: AsyncSession, project_id: UUID):
-        result = await db.execute(select(Project).where(Project.id == project_id))
+        result = await db.execute(statements.project_by_id(project_id))
         project = result.scalar_one_or_none()
         if not project:
             raise HTTPException(404, "Project not found")
         return project
 
+    @staticmethod
+    async def get_project_fields(db: AsyncSession, project_id: UUID, fields: tuple):
+        """
+        get_project for a sparse fieldset: one Core row holding `fields`,
+        plus the owner_id that ensure_project_access reads.
+        """
+        checked = (Project.owner_id,) if "owner_id" not in fields else ()
+        result = await db.execute(
+            select(*entity_columns(Project, fields), *checked).where(Project.id == project_id)
+        )
+        row = result.first()
+        if not row:
+            raise HTTPException(404, "Project not found")
+        return row
+
     # UPDATE (ADMIN/MANAGER)
     @staticmethod
     async def update_project(db: AsyncSession, project_id: UUID, data: ProjectUpdate):
-        result = await db.execute(select(Project).where(Project.id == project_id))
-        project = result.scalar_one_or_none()
+        project = await update_returning(
+            db,
+            Project,
+            Project.id == project_id,
+            **data.dict(exclude_unset=True),
+            updated_at=func.now(),
+        )
         if not project:
             raise HTTPException(404, "Project not found")
 
-        for field, value in data.dict(exclude_unset=True).items():
-            setattr(project, field, value)
-
-        project.updated_at = datetime.now(timezone.utc)
         await db.commit()
-        await db.refresh(project)
         return project
 
     # DELETE
     @staticmethod
     async def delete_project(db: AsyncSession, project_id: UUID):
-        result = await db.execute(select(Project).where(Project.id == project_id))
+        result = await db.execute(statements.project_by_id(project_id))
         project = result.scalar_one_or_none()
 
         if not project:
@@ -100,9 +125,10 @@ class ProjectService:
         page: int = 1,
         limit: int = 20,
         current_user=None,
+        cursor: str | None = None,
+        count: str = "exact",
+        fields: tuple = LIST_FIELDS,
     ):
-        skip, limit = paginate(page, limit)
-
         # ------------------------------------------------------------
         # 1. Build dynamic WHERE conditions
         # ------------------------------------------------------------
@@ -127,15 +153,11 @@ class ProjectService:
         if status:
             conditions.append(Project.status == status)
 
-        # Search (title or description)
+        # Search (name or description, SEARCH_MODE)
+        matched = None
         if search:
-            like = f"%{search.lower()}%"
-            conditions.append(
-                or_(
-                    func.lower(Project.name).like(like),
-                    func.lower(Project.description).like(like)
-                )
-            )
+            matched = build_search(search, Project.search_vector, [Project.name, Project.description])
+            conditions.append(matched.condition)
 
         # Date range filter
         if date_from:
@@ -145,34 +167,26 @@ class ProjectService:
             conditions.append(Project.created_at <= date_to)
 
         # ------------------------------------------------------------
-        # 2. Count total (with filters)
-        # ------------------------------------------------------------
-        count_query = select(func.count()).select_from(Project)
-        if conditions:
-            count_query = count_query.where(*conditions)
-
-        total = await db.scalar(count_query)
-
-        # ------------------------------------------------------------
-        # 3. Fetch paginated projects
+        # 2. Fetch the page (+ total, per the count strategy)
         # ------------------------------------------------------------
-        query = (
-            select(Project)
-            .where(*conditions)
-            .order_by(Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        columns = ()
+        if matched and matched.snippet is not None and "snippet" in fields:
+            columns = (matched.snippet.label("snippet"),)
+
+        rows, pagination = await fetch_page(
+            db,
+            Project,
+            conditions,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            rank=matched.rank if matched else None,
+            columns=columns,
+            fields=entity_columns(Project, fields),
         )
 
-        result = await db.execute(query)
-        projects = result.scalars().all()
-
-        # ------------------------------------------------------------
-        # 4. Build pagination block
-        # ------------------------------------------------------------
-        pagination = build_pagination_metadata(page, limit, total)
-
-        return projects, pagination
+        return rows, pagination
 
     @staticmethod
     async def ensure_project_access(db: AsyncSession, project: Project, current_user):
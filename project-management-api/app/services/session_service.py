@@ -2,9 +2,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, func, or_
 from datetime import datetime, timezone, timedelta
 
+from app.config import get_settings
 from app.models.session import Session
-from app.utils.pagination import paginate, build_pagination_metadata
+from app.schemas.response import SessionResponse
+from app.utils.pagination import fetch_page
 from app.utils.auth import hash_refresh_token, verify_refresh_token
+from app.utils.revocation import revoke_session, revoke_user
+from app.utils.records import schema_columns
+from app.utils.writes import insert_returning
+
+
+settings = get_settings()
+
+# Beyond this many evictions in one go, revoke per user instead of per session
+MAX_SINGLE_REVOCATIONS = 20
+
+# Session lists select only these (Core rows, see app/utils/records.py)
+LIST_COLUMNS = schema_columns(Session, SessionResponse)
 
 
 class SessionService:
@@ -24,7 +38,11 @@ class SessionService:
     ):
         now = datetime.now(timezone.utc)
 
-        session = Session(
+        await SessionService._evict_over_cap(db, user_id)
+
+        session = await insert_returning(
+            db,
+            Session,
             user_id=user_id,
             refresh_token_hash=hash_refresh_token(refresh_token),
             device_name=device_name,
@@ -35,11 +53,53 @@ class SessionService:
             refresh_token_expires_at=now + timedelta(days=30),
         )
 
-        db.add(session)
         await db.commit()
-        await db.refresh(session)
         return session
 
+    @staticmethod
+    async def _evict_over_cap(db: AsyncSession, user_id):
+        """
+        Keep at most MAX_ACTIVE_SESSIONS_PER_USER active sessions (counting the
+        one about to be created): deactivate the least recently used ones in
+        the same transaction as the insert.
+
+        Concurrent logins of one user are serialized on a transaction-level
+        advisory lock: otherwise each would count the same active sessions
+        and all of them insert, exceeding the cap.
+        """
+        cap = settings.MAX_ACTIVE_SESSIONS_PER_USER
+        if cap <= 0:
+            return
+
+        # Separate statement: under READ COMMITTED the UPDATE below must take
+        # its snapshot after the lock, to see a concurrent login's insert
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(user_id)))))
+
+        keep = (
+            select(Session.id)
+            .where(Session.user_id == user_id)
+            .where(Session.is_active == True)
+            .order_by(func.coalesce(Session.last_used_at, Session.created_at).desc())
+            .limit(cap - 1)
+        )
+
+        result = await db.execute(
+            update(Session)
+            .where(Session.user_id == user_id)
+            .where(Session.is_active == True)
+            .where(Session.id.not_in(keep))
+            .values(is_active=False)
+            .returning(Session.id)
+            .execution_options(synchronize_session=False)
+        )
+        evicted = result.scalars().all()
+
+        if len(evicted) > MAX_SINGLE_REVOCATIONS:
+            await revoke_user(db, user_id)
+        else:
+            for session_id in evicted:
+                await revoke_session(db, session_id)
+
     # ---------------------------------------------------------
     # 🔥 REQUIRED: GET ONE SESSION (BY ID)
     # ---------------------------------------------------------
@@ -88,8 +148,8 @@ class SessionService:
             return False
 
         session.is_active = False
+        await revoke_session(db, session_id)
         await db.commit()
-        await db.refresh(session)
         return True
 
     # ---------------------------------------------------------
@@ -102,20 +162,32 @@ class SessionService:
             .where(Session.user_id == user_id)
             .values(is_active=False)
         )
+        await revoke_user(db, user_id)
         await db.commit()
         return True
 
     # ---------------------------------------------------------
-    # LIST USER SESSIONS
+    # LIST USER SESSIONS (ACTIVE ONLY, PAGINATED)
     # ---------------------------------------------------------
     @staticmethod
-    async def list_user_sessions(db: AsyncSession, user_id):
-        result = await db.execute(
-            select(Session)
-            .where(Session.user_id == user_id)
-            .order_by(Session.created_at.desc())
+    async def list_user_sessions(
+        db: AsyncSession,
+        user_id,
+        page: int = 1,
+        limit: int = 20,
+        cursor: str | None = None,
+        count: str = "exact",
+    ):
+        # Served by ix_sessions_user_id_is_active_created_at
+        conditions = [
+            Session.user_id == user_id,
+            Session.is_active == True,
+        ]
+
+        return await fetch_page(
+            db, Session, conditions, page=page, limit=limit, cursor=cursor, count=count,
+            fields=LIST_COLUMNS,
         )
-        return result.scalars().all()
 
     # ---------------------------------------------------------
     # FILTER + SEARCH + PAGINATE SESSIONS
@@ -133,9 +205,9 @@ class SessionService:
         include_inactive: bool = False,
         page: int = 1,
         limit: int = 20,
+        cursor: str | None = None,
+        count: str = "exact",
     ):
-        skip, limit = paginate(page, limit)
-
         conditions = []
 
         if user_id:
@@ -170,25 +242,8 @@ class SessionService:
         if not include_inactive:
             conditions.append(Session.is_active == True)
 
-        # Count
-        count_q = select(func.count()).select_from(Session)
-        if conditions:
-            count_q = count_q.where(*conditions)
-
-        total = await db.scalar(count_q)
-
-        # Query
-        query = (
-            select(Session)
-            .where(*conditions)
-            .order_by(Session.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        # Query (+ total, per the count strategy)
+        return await fetch_page(
+            db, Session, conditions, page=page, limit=limit, cursor=cursor, count=count,
+            fields=LIST_COLUMNS,
         )
-
-        result = await db.execute(query)
-        rows = result.scalars().all()
-
-        pagination = build_pagination_metadata(page, limit, total)
-
-        return rows, pagination
@@ -1,21 +1,30 @@
 # app/services/task_service.py
 
-from datetime import datetime, timezone
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, or_, select
+from sqlalchemy import delete, false, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.enums import UserRole
 from app.models.project import Project
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
-from app.utils.pagination import paginate, build_pagination_metadata
-
+from app.schemas.response import TaskListItem
+from app.schemas.task import TaskCreate, TaskPublic, TaskUpdate
+from app.utils.pagination import fetch_page
+from app.utils.records import entity_columns
+from app.utils.search import build_search
+from app.utils.writes import insert_returning, update_returning
+from app.utils import statements
 
 
 class TaskService:
+    # ?fields= whitelists (sparse fieldsets, see app/utils/records.py). Lists
+    # default to the list item, which leaves out the unbounded description.
+    DETAIL_FIELDS = tuple(TaskPublic.model_fields)
+    LIST_FIELDS = tuple(TaskListItem.model_fields)
+    ALLOWED_LIST_FIELDS = DETAIL_FIELDS + ("snippet",)
 
     @staticmethod
     def _role_value(user) -> str:
@@ -26,7 +35,7 @@ class TaskService:
 
     @staticmethod
     async def _get_project(db: AsyncSession, project_id: UUID):
-        result = await db.execute(select(Project).where(Project.id == project_id))
+        result = await db.execute(statements.project_by_id(project_id))
         project = result.scalar_one_or_none()
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
@@ -93,12 +102,45 @@ class TaskService:
 
         raise HTTPException(status_code=403, detail="Access denied")
 
+    @staticmethod
+    def _write_scope(user):
+        """
+        WHERE clause matching the tasks `user` may mutate, so the permission
+        check rides along in the UPDATE/DELETE itself.
+        """
+        role = TaskService._role_value(user)
+
+        if role == UserRole.admin.value:
+            return true()
+
+        if role == UserRole.manager.value:
+            owned = select(Project.id).where(Project.owner_id == user.id).scalar_subquery()
+            return Task.project_id.in_(owned)
+
+        if role == UserRole.developer.value:
+            return Task.assigned_to == user.id
+
+        return false()
+
+    @staticmethod
+    async def _raise_write_denied(db: AsyncSession, task_id: UUID, user):
+        """
+        A scoped write matched nothing: one SELECT tells a missing task (404)
+        from one outside the user's scope (403).
+        """
+        task = await TaskService.get_task(db, task_id)
+        await TaskService._ensure_task_access(db, task, user)
+        # Matched on retry: the task changed hands between the two statements
+        raise HTTPException(status_code=409, detail="Task was modified concurrently, retry")
+
     # CREATE TASK
     @staticmethod
     async def create_task(db: AsyncSession, data: TaskCreate, user):
         await TaskService._ensure_project_management(db, data.project_id, user)
 
-        new_task = Task(
+        new_task = await insert_returning(
+            db,
+            Task,
             title=data.title,
             description=data.description,
             status=data.status,
@@ -110,15 +152,13 @@ class TaskService:
             estimated_hours=data.estimated_hours,
         )
 
-        db.add(new_task)
         await db.commit()
-        await db.refresh(new_task)
         return new_task
 
     # GET TASK
     @staticmethod
     async def get_task(db: AsyncSession, task_id: UUID, current_user=None):
-        result = await db.execute(select(Task).where(Task.id == task_id))
+        result = await db.execute(statements.task_by_id(task_id))
         task = result.scalar_one_or_none()
         if not task:
             raise HTTPException(404, "Task not found")
@@ -128,6 +168,25 @@ class TaskService:
 
         return task
 
+    @staticmethod
+    async def get_task_fields(db: AsyncSession, task_id: UUID, fields: tuple, current_user=None):
+        """
+        get_task for a sparse fieldset: one Core row holding `fields`, plus
+        the columns the access check reads.
+        """
+        checked = tuple(col for col in (Task.project_id, Task.assigned_to) if col.key not in fields)
+        result = await db.execute(
+            select(*entity_columns(Task, fields), *checked).where(Task.id == task_id)
+        )
+        row = result.first()
+        if not row:
+            raise HTTPException(404, "Task not found")
+
+        if current_user:
+            await TaskService._ensure_task_access(db, row, current_user)
+
+        return row
+
     # LIST
     @staticmethod
     async def list_tasks(
@@ -142,9 +201,10 @@ class TaskService:
         page: int = 1,
         limit: int = 20,
         current_user=None,
+        cursor: str | None = None,
+        count: str = "exact",
+        fields: tuple = LIST_FIELDS,
     ):
-        skip, limit = paginate(page, limit)
-
         # ------------------------------------------------------------
         # 1. Dynamic Filters
         # ------------------------------------------------------------
@@ -162,15 +222,11 @@ class TaskService:
         if priority:
             conditions.append(Task.priority == priority)
 
-        # Search across task title & description
+        # Search across task title & description (SEARCH_MODE)
+        matched = None
         if search:
-            like = f"%{search.lower()}%"
-            conditions.append(
-                or_(
-                    func.lower(Task.title).like(like),
-                    func.lower(Task.description).like(like)
-                )
-            )
+            matched = build_search(search, Task.search_vector, [Task.title, Task.description])
+            conditions.append(matched.condition)
 
         # Date range filter (due_date)
         if date_from:
@@ -191,82 +247,85 @@ class TaskService:
                 conditions.append(Task.assigned_to == current_user.id)
 
         # ------------------------------------------------------------
-        # 2. Count total tasks with filters
+        # 2. Fetch the page (+ total, per the count strategy)
         # ------------------------------------------------------------
-        count_query = select(func.count()).select_from(Task)
-
-        if conditions:
-            count_query = count_query.where(*conditions)
-
-        total = await db.scalar(count_query)
-
-        # ------------------------------------------------------------
-        # 3. Fetch paginated tasks
-        # ------------------------------------------------------------
-        query = (
-            select(Task)
-            .where(*conditions)
-            .order_by(Task.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        columns = ()
+        if matched and matched.snippet is not None and "snippet" in fields:
+            columns = (matched.snippet.label("snippet"),)
+
+        rows, pagination = await fetch_page(
+            db,
+            Task,
+            conditions,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            rank=matched.rank if matched else None,
+            columns=columns,
+            fields=entity_columns(Task, fields),
         )
 
-        result = await db.execute(query)
-        tasks = result.scalars().all()
-
-        # ------------------------------------------------------------
-        # 4. Pagination metadata
-        # ------------------------------------------------------------
-        pagination = build_pagination_metadata(page, limit, total)
-
-        return tasks, pagination
+        return rows, pagination
 
     # UPDATE TASK
     @staticmethod
     async def update_task(db: AsyncSession, task_id: UUID, data, user):
 
-        task = await TaskService.get_task(db, task_id)
-
         role = TaskService._role_value(user)
         if role == UserRole.developer.value:
             raise HTTPException(status_code=403, detail="Developers cannot update tasks")
 
-        await TaskService._ensure_task_access(db, task, user)
-
-        for field, value in data.dict(exclude_unset=True).items():
-            setattr(task, field, value)
+        task = await update_returning(
+            db,
+            Task,
+            Task.id == task_id,
+            TaskService._write_scope(user),
+            **data.dict(exclude_unset=True),
+            updated_at=func.now(),
+        )
+        if task is None:
+            await TaskService._raise_write_denied(db, task_id, user)
 
-        task.updated_at = datetime.now(timezone.utc)
         await db.commit()
-        await db.refresh(task)
         return task
 
     # UPDATE STATUS
     @staticmethod
     async def update_status(db: AsyncSession, task_id: UUID, new_status, user):
 
-        task = await TaskService.get_task(db, task_id)
-        await TaskService._ensure_task_access(db, task, user)
-
-        task.status = new_status
-        task.updated_at = datetime.now(timezone.utc)
+        task = await update_returning(
+            db,
+            Task,
+            Task.id == task_id,
+            TaskService._write_scope(user),
+            status=new_status,
+            updated_at=func.now(),
+        )
+        if task is None:
+            await TaskService._raise_write_denied(db, task_id, user)
 
         await db.commit()
-        await db.refresh(task)
         return task
 
     # DELETE TASK
     @staticmethod
     async def delete_task(db: AsyncSession, task_id: UUID, user):
 
-        task = await TaskService.get_task(db, task_id)
-
         role = TaskService._role_value(user)
         if role == UserRole.developer.value:
+            # A missing task is still a 404, before the role refusal
+            await TaskService.get_task(db, task_id)
             raise HTTPException(status_code=403, detail="Developers cannot delete tasks")
 
-        await TaskService._ensure_task_access(db, task, user)
-        await db.delete(task)
+        deleted = await db.scalar(
+            delete(Task)
+            .where(Task.id == task_id, TaskService._write_scope(user))
+            .returning(Task.id)
+        )
+        if deleted is None:
+            await TaskService._raise_write_denied(db, task_id, user)
+
         await db.commit()
         return True
 
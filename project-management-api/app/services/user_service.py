@@ -1,7 +1,8 @@
 # app/services/user_service.py
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
 from uuid import uuid4, UUID 
 from datetime import datetime
@@ -9,17 +10,47 @@ from datetime import datetime
 from app.models.user import User
 from app.schemas.user import UserCreate, UserRegister
 from app.models.enums import UserRole 
-from app.utils.auth import (
-    hash_password,
-    verify_password,
-    create_access_token
-)
+from app.utils.password_hasher import password_hasher
 from app.services.session_service import SessionService
-from app.utils.pagination import paginate, build_pagination_metadata
+from app.services.auth_service import AuthService
+from app.utils.revocation import revoke_user
+from app.utils.pagination import paginate, build_pagination_metadata, fetch_page
 from app.schemas.user import UserCreate, UserRegister, UserUpdate
+from app.schemas.response import UserListItem, UserResponse
+from app.utils.records import entity_columns
 
 
 class UserService:
+    # ?fields= whitelist for list_users (sparse fieldsets, see app/utils/records.py)
+    LIST_FIELDS = tuple(UserListItem.model_fields)
+    ALLOWED_LIST_FIELDS = tuple(UserResponse.model_fields)
+
+    @staticmethod
+    async def _insert_user(db: AsyncSession, **values) -> User:
+        """
+        One INSERT ... ON CONFLICT DO NOTHING RETURNING round trip.
+        Only when it inserts nothing does a SELECT find which unique key clashed.
+        """
+        stmt = (
+            pg_insert(User)
+            .values(**values)
+            .on_conflict_do_nothing()
+            .returning(User)
+        )
+        new_user = (await db.scalars(stmt)).first()
+
+        if new_user is None:
+            result = await db.execute(
+                select(User.email, User.username)
+                .where(or_(User.email == values["email"], User.username == values["username"]))
+            )
+            await db.rollback()
+            if any(row.email == values["email"] for row in result.all()):
+                raise HTTPException(status_code=409, detail="Email already registered")
+            raise HTTPException(status_code=409, detail="Username already taken")
+
+        await db.commit()
+        return new_user
 
     @staticmethod
     async def register_user(db: AsyncSession, user_data: UserRegister):
@@ -27,59 +58,34 @@ class UserService:
         Handles public registration.
         Validates email/username and sets default role.
         """
-        # Check unique email
-        result = await db.execute(select(User).where(User.email == user_data.email))
-        if result.scalar_one_or_none():
-            raise HTTPException(status_code=409, detail="Email already registered")
-
-        # Check unique username
-        result = await db.execute(select(User).where(User.username == user_data.username))
-        if result.scalar_one_or_none():
-            raise HTTPException(status_code=409, detail="Username already taken")
+        # Hash first, before any query checks out a pooled connection
+        password_hash = await password_hasher.hash(user_data.password)
 
-        # Create new user
-        new_user = User(
-            id=uuid4(), 
+        return await UserService._insert_user(
+            db,
             email=user_data.email,
             username=user_data.username,
             full_name=user_data.full_name,
-            password_hash=hash_password(user_data.password),
-            role=UserRole.developer  
+            password_hash=password_hash,
+            role=UserRole.developer,
         )
 
-        db.add(new_user)
-        await db.commit()
-        await db.refresh(new_user)
-        return new_user
-
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate):
         """
         Handles user creation by an admin.
         """
-        # Check unique email
-        result = await db.execute(select(User).where(User.email == user_data.email))
-        if result.scalar_one_or_none():
-            raise HTTPException(status_code=409, detail="Email already registered")
-
-        # Check unique username
-        result = await db.execute(select(User).where(User.username == user_data.username))
-        if result.scalar_one_or_none():
-            raise HTTPException(status_code=409, detail="Username already taken")
+        # Hash first, before any query checks out a pooled connection
+        password_hash = await password_hasher.hash(user_data.password)
 
-        # Create new user
-        new_user = User(
+        return await UserService._insert_user(
+            db,
             email=user_data.email,
             username=user_data.username,
             full_name=user_data.full_name,
-            password_hash=hash_password(user_data.password),
+            password_hash=password_hash,
             role=user_data.role,
         )
-
-        db.add(new_user)
-        await db.commit()
-        await db.refresh(new_user)
-        return new_user
     
     @staticmethod
     async def update_user(db: AsyncSession, user_id: UUID, data: UserUpdate):
@@ -102,9 +108,10 @@ class UserService:
         # 3. Commit
         user.updated_at = datetime.now() 
         db.add(user)
+        await revoke_user(db, user.id)
         await db.commit()
         await db.refresh(user)
-        
+
         return user
 
     @staticmethod
@@ -117,11 +124,25 @@ class UserService:
         user_agent: str = "unknown",
         ip: str = "unknown",
     ):
-        # Fetch user
-        result = await db.execute(select(User).where(User.email == email))
-        user = result.scalar_one_or_none()
+        # Fetch only what login needs
+        result = await db.execute(
+            select(User.id, User.password_hash, User.is_active, User.role)
+            .where(User.email == email)
+        )
+        user = result.one_or_none()
+
+        # End the read transaction so the pooled connection is returned
+        # while bcrypt runs
+        await db.rollback()
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid email or password"
+            )
+
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -133,6 +154,14 @@ class UserService:
                 detail="Account is disabled. Please contact admin."
             )
 
+        # Transparent rehash (committed together with the new session)
+        if new_hash:
+            await db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(password_hash=new_hash)
+            )
+
         refresh_token = str(uuid4())
         session = await SessionService.create_session(
             db=db,
@@ -143,10 +172,9 @@ class UserService:
             user_agent=user_agent,
             ip=ip,
         )
-        access_token = create_access_token({
-            "user_id": str(user.id),
-            "session_id": str(session.id)
-        })
+        access_token = AuthService.issue_access_token(
+            user.id, session.id, role=user.role, is_active=user.is_active
+        )
 
         return {
             "access_token": access_token,
@@ -188,10 +216,11 @@ class UserService:
         date_from: datetime | None = None,
         date_to: datetime | None = None,
         page: int = 1,
-        limit: int = 20
+        limit: int = 20,
+        cursor: str | None = None,
+        count: str = "exact",
+        fields: tuple = LIST_FIELDS,
     ):
-        skip, limit = paginate(page, limit)
-
         conditions = []
 
         if role:
@@ -213,23 +242,10 @@ class UserService:
         if date_to:
             conditions.append(User.created_at <= date_to)
 
-        # Count
-        count_query = select(func.count()).select_from(User)
-        if conditions:
-            count_query = count_query.where(*conditions)
-        total = await db.scalar(count_query)
-
-        # Fetch users
-        query = (
-            select(User)
-            .where(*conditions)
-            .order_by(User.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        # Fetch users (+ total, per the count strategy)
+        rows, pagination = await fetch_page(
+            db, User, conditions, page=page, limit=limit, cursor=cursor, count=count,
+            fields=entity_columns(User, fields),
         )
-        result = await db.execute(query)
-        users = result.scalars().all()
-
-        pagination = build_pagination_metadata(page, limit, total)
 
-        return users, pagination
\ No newline at end of file
+        return rows, pagination
\ No newline at end of file
@@ -1,16 +1,24 @@
 # app/utils/auth.py
 
+import hashlib
+import hmac
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from passlib.context import CryptContext
-from jose import jwt, JWTError
+from jose import JWTError
 
-# Config — ensure these env vars exist in your .env
-import os
-SECRET_KEY = os.getenv("SECRET_KEY", "please_change_me")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))  # e.g., 60
+from app.config import get_settings
+from app.utils.tokens import token_verifier
+
+# Config — single source of truth is app.config.Settings
+settings = get_settings()
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Refresh tokens are random UUIDs, so a keyed digest is enough (no need for bcrypt)
+REFRESH_TOKEN_HASH_SCHEME = settings.REFRESH_TOKEN_HASH_SCHEME
+REFRESH_TOKEN_PEPPER = settings.REFRESH_TOKEN_PEPPER or settings.SECRET_KEY
+REFRESH_DIGEST_PREFIX = "hmac-sha256$"
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -26,18 +34,38 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """Returns (valid, new_hash); new_hash is set when the stored hash is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 # ------------------------
 # Refresh token helpers
 # ------------------------
+def _refresh_digest(token: str) -> str:
+    return hmac.new(
+        REFRESH_TOKEN_PEPPER.encode(),
+        token.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
 def hash_refresh_token(token: str) -> str:
-    # use the same bcrypt hash for refresh tokens
-    return pwd_context.hash(token)
+    if REFRESH_TOKEN_HASH_SCHEME == "bcrypt":
+        return pwd_context.hash(token)
+    return REFRESH_DIGEST_PREFIX + _refresh_digest(token)
 
 
 def verify_refresh_token(plain_token: str, hashed: str) -> bool:
+    if hashed.startswith(REFRESH_DIGEST_PREFIX):
+        expected = hashed[len(REFRESH_DIGEST_PREFIX):]
+        return hmac.compare_digest(_refresh_digest(plain_token), expected)
+
+    # Legacy bcrypt hash — replaced by a digest when the refresh rotates it
     return pwd_context.verify(plain_token, hashed)
 
 
+
 # ------------------------
 # JWT helpers
 # ------------------------
@@ -46,17 +74,20 @@ def create_access_token(data: Dict[str, Any], expires_minutes: Optional[int] = N
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=(expires_minutes or ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": int(expire.timestamp()), "iat": int(now.timestamp())})
-    token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    token = token_verifier.sign(to_encode)
     return token
 
 
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = token_verifier.verify(token)
     except JWTError:
         return None
 
+    if payload.get("exp", 0) < datetime.now(timezone.utc).timestamp():
+        return None
+    return payload
+
 
 def create_access_token_for_user(user: Any, expires_minutes: Optional[int] = None) -> str:
     """
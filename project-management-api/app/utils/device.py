@@ -1,54 +1,143 @@
 # app/utils/device.py
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
 from fastapi import Request
 
+from app.config import get_settings
+
+
+settings = get_settings()
+
+
 def extract_ip(request: Request) -> str:
-    # Try common reverse-proxy headers first, then fallback to client host
-    x_forwarded_for = request.headers.get("x-forwarded-for")
-    if x_forwarded_for:
-        # X-Forwarded-For can contain a list of IPs
-        return x_forwarded_for.split(",")[0].strip()
-    x_real_ip = request.headers.get("x-real-ip")
-    if x_real_ip:
-        return x_real_ip
-    client = request.client
-    if client:
-        return client.host
-    return "unknown"
+    """
+    Client address as seen by the first hop we trust.
 
-def extract_device_info(request: Request) -> dict:
+    Each proxy appends the address it received the request from to
+    X-Forwarded-For, so with TRUSTED_PROXY_COUNT proxies in front of the
+    app the client is that many entries from the right. Anything further
+    left was sent by the client and can be forged (it must never key the
+    login throttle). With no trusted proxies the header is ignored.
     """
-    Very small UA parsing for device_name + device_os.
-    If you want richer parsing, install `user-agents` or similar later.
+    client_host = request.client.host if request.client else "unknown"
+
+    hops = settings.TRUSTED_PROXY_COUNT
+    if hops > 0:
+        x_forwarded_for = request.headers.get("x-forwarded-for")
+        if x_forwarded_for:
+            forwarded = [ip.strip() for ip in x_forwarded_for.split(",")]
+            if len(forwarded) >= hops:
+                return forwarded[-hops]
+    return client_host
+
+
+# ---------------------------------------------------------
+# USER-AGENT RULE TABLES
+# Order matters: the first matching rule wins. Most UAs claim to be
+# several browsers at once (Edge/Opera/Samsung say "Chrome", Chrome says
+# "Safari", iOS says "like Mac OS X"), so the specific ones come first.
+# ---------------------------------------------------------
+BOT_RULES = [
+    ("Googlebot", re.compile(r"Googlebot/([\d.]+)")),
+    ("Bingbot", re.compile(r"bingbot/([\d.]+)", re.I)),
+    # "bot" as a word or a "<name>bot/" product token, so e.g. Cubot phones are not bots
+    ("Bot", re.compile(r"\bbot\b|[a-z]+bot/|crawler|spider|slurp|facebookexternalhit|headless", re.I)),
+]
+
+CLIENT_RULES = [
+    ("Curl", re.compile(r"curl/([\d.]+)", re.I)),
+    ("Wget", re.compile(r"Wget/([\d.]+)", re.I)),
+    ("Postman", re.compile(r"PostmanRuntime/([\d.]+)")),
+    ("Insomnia", re.compile(r"insomnia/([\d.]+)", re.I)),
+    ("Python Requests", re.compile(r"python-requests/([\d.]+)")),
+    ("HTTPX", re.compile(r"python-httpx/([\d.]+)")),
+    ("Go HTTP Client", re.compile(r"Go-http-client/([\d.]+)")),
+    ("OkHttp", re.compile(r"okhttp/([\d.]+)", re.I)),
+]
+
+BROWSER_RULES = [
+    ("Edge", re.compile(r"Edg(?:e|A|iOS)?/([\d.]+)")),
+    ("Opera", re.compile(r"(?:OPR|Opera)/([\d.]+)")),
+    ("Samsung Internet", re.compile(r"SamsungBrowser/([\d.]+)")),
+    ("Firefox", re.compile(r"(?:Firefox|FxiOS)/([\d.]+)")),
+    ("Chrome", re.compile(r"(?:Chrome|CriOS)/([\d.]+)")),
+    ("Safari", re.compile(r"Version/([\d.]+).*Safari/")),
+    ("Safari", re.compile(r"AppleWebKit/([\d.]+)")),
+]
+
+OS_RULES = [
+    ("iOS", re.compile(r"(?:iPhone|iPad|iPod).*?OS ([\d_]+)")),
+    ("Android", re.compile(r"Android ?([\d.]*)")),
+    ("Windows", re.compile(r"Windows NT ([\d.]+)")),
+    ("Windows", re.compile(r"Windows()")),
+    ("ChromeOS", re.compile(r"CrOS \S+ ([\d.]+)")),
+    ("macOS", re.compile(r"Mac OS X ([\d_.]+)")),
+    ("macOS", re.compile(r"Macintosh|macOS()")),
+    ("Linux", re.compile(r"Linux()")),
+]
+
+TABLET = re.compile(r"iPad|Tablet|Kindle|Silk/")
+MOBILE = re.compile(r"Mobi|iPhone|iPod|Android")
+
+
+class UserAgentInfo(NamedTuple):
+    browser: str
+    browser_version: str
+    os: str
+    os_version: str
+    device_class: str  # desktop | mobile | tablet | bot
+    is_bot: bool
+
+
+def _match(rules, ua: str):
+    for name, pattern in rules:
+        match = pattern.search(ua)
+        if match:
+            version = match.group(1) if match.groups() else ""
+            return name, (version or "").replace("_", ".")
+    return None
+
+
+@lru_cache(maxsize=1024)
+def parse_user_agent(ua: str) -> UserAgentInfo:
     """
-    ua = request.headers.get("user-agent", "unknown").lower()
-
-    # Basic OS detection
-    if "windows" in ua:
-        os = "Windows"
-    elif "macintosh" in ua or "mac os" in ua or "macos" in ua:
-        os = "macOS"
-    elif "iphone" in ua or "ipad" in ua:
-        os = "iOS"
-    elif "android" in ua:
-        os = "Android"
-    elif "linux" in ua:
-        os = "Linux"
-    else:
-        os = "Unknown"
-
-    # Basic browser/device
-    if "chrome" in ua and "safari" in ua:
-        device = "Chrome"
-    elif "safari" in ua and "chrome" not in ua:
-        device = "Safari"
-    elif "firefox" in ua:
-        device = "Firefox"
-    elif "edg" in ua or "edge" in ua:
-        device = "Edge"
-    elif "curl" in ua:
-        device = "Curl"
+    Classify a raw User-Agent string. Cached per distinct UA: real traffic
+    only has a few hundred of them.
+    """
+    os_name, os_version = _match(OS_RULES, ua) or ("Unknown", "")
+
+    bot = _match(BOT_RULES, ua) or _match(CLIENT_RULES, ua)
+    if bot:
+        return UserAgentInfo(bot[0], bot[1], os_name, os_version, "bot", True)
+
+    browser, browser_version = _match(BROWSER_RULES, ua) or ("Browser", "")
+
+    if TABLET.search(ua) or (os_name == "Android" and "Mobile" not in ua):
+        device_class = "tablet"
+    elif MOBILE.search(ua):
+        device_class = "mobile"
     else:
-        device = "Browser"
+        device_class = "desktop"
+
+    return UserAgentInfo(browser, browser_version, os_name, os_version, device_class, False)
+
+
+def extract_device_info(request: Request) -> dict:
+    """
+    Rule-table UA parsing for device_name + device_os (see parse_user_agent).
+    """
+    user_agent = request.headers.get("user-agent", "")[:1024]
+    info = parse_user_agent(user_agent)
 
-    device_name = f"{device} on {os}"
-    return {"device_name": device_name, "device_os": os, "user_agent": request.headers.get("user-agent", "")}
+    device_name = f"{info.browser} on {info.os}"
+    return {
+        "device_name": device_name,
+        "device_os": info.os,
+        "user_agent": user_agent,
+        "browser": info.browser,
+        "browser_version": info.browser_version,
+        "device_class": info.device_class,
+        "is_bot": info.is_bot,
+    }
@@ -46,7 +46,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     return JSONResponse(
         status_code=exc.status_code,
-        content=format_error(str(exc.detail), exc.status_code)
+        content=format_error(str(exc.detail), exc.status_code),
+        headers=getattr(exc, "headers", None),
     )
 
 
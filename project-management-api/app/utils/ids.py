@@ -0,0 +1,58 @@
+# app/utils/ids.py
+
+import os
+import threading
+import time
+import uuid
+
+
+# ---------------------------------------------------------
+# UUIDv7 (RFC 9562)
+# 48-bit Unix millisecond timestamp | version 7 | 12-bit counter | variant | 62 random bits
+#
+# New keys sort by creation time, so inserts append to the right edge of the
+# primary-key B-tree instead of splitting random leaf pages. They are plain
+# uuid.UUID values: existing UUID(as_uuid=True) columns and v4 rows are
+# unaffected.
+# ---------------------------------------------------------
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID. Within one millisecond the 12-bit rand_a field is a
+    counter (seeded randomly each millisecond), so ids generated by this
+    process are strictly increasing; on counter overflow or clock step back
+    the timestamp is advanced past the last one used.
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Top bit clear leaves room for >= 2048 ids in the same millisecond
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    value = (
+        (ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
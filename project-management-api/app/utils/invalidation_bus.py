@@ -0,0 +1,185 @@
+# app/utils/invalidation_bus.py
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections.abc import Callable
+from uuid import uuid4
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class InvalidationBus:
+    """
+    Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+    - Services call `publish(db, entity, id)` BEFORE `db.commit()`: NOTIFY is
+      transactional, so the event is delivered to every listener exactly
+      when (and only if) the change commits.
+    - Every worker runs `run()` as a background task; received events are
+      dispatched to the handlers subscribed for that entity.
+    - Events from this worker are skipped (it evicts locally on commit).
+    - Only publish entities some worker subscribes to ("session", "user",
+      "write" today): an unconsumed NOTIFY is a wasted round trip.
+    - After any (re)connect the listener may have missed events, so all
+      flush handlers run. They only drop or reload state that can be rebuilt
+      from the database (caches, the revocation epochs); nothing is derived
+      from this worker's connect time.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "cache_invalidation",
+        enabled: bool = True,
+        reconnect_delay: float = 1.0,
+        health_check_interval: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.enabled = enabled
+        self.reconnect_delay = reconnect_delay
+        self.health_check_interval = health_check_interval
+
+        self.origin = uuid4().hex[:12]
+
+        self._handlers: dict[str, list[Callable]] = {}
+        self._flush_handlers: list[Callable] = []
+
+        self.published = 0
+        self.received = 0
+        self.flushes = 0
+        self.reconnects = 0
+
+    # ---------------------------------------------------------
+    # SUBSCRIPTIONS
+    # ---------------------------------------------------------
+    def subscribe(self, entity: str, handler: Callable):
+        """handler(entity_id: str, generation: int)"""
+        self._handlers.setdefault(entity, []).append(handler)
+
+    def on_flush(self, handler: Callable):
+        """handler(); may be a coroutine function (awaited in order)."""
+        self._flush_handlers.append(handler)
+
+    # ---------------------------------------------------------
+    # PUBLISH
+    # ---------------------------------------------------------
+    async def publish(self, db: AsyncSession, entity: str, entity_id, generation: int | None = None) -> int:
+        generation = generation or _now_ms()
+        if not self.enabled:
+            return generation
+
+        await db.execute(self.notify_statement(entity, entity_id, generation))
+        return generation
+
+    def notify_statement(self, entity: str, entity_id, generation: int | None = None):
+        """The NOTIFY itself, for callers that can't await (e.g. sync Session events)."""
+        payload = json.dumps({
+            "o": self.origin,
+            "e": entity,
+            "i": str(entity_id),
+            "g": generation or _now_ms(),
+        })
+        self.published += 1
+        return select(func.pg_notify(self.channel, payload))
+
+    # ---------------------------------------------------------
+    # DISPATCH
+    # ---------------------------------------------------------
+    def dispatch(self, entity: str, entity_id: str, generation: int):
+        for handler in self._handlers.get(entity, ()):
+            try:
+                handler(entity_id, generation)
+            except Exception:
+                logger.exception("Invalidation handler failed for %s:%s", entity, entity_id)
+
+    async def flush(self):
+        self.flushes += 1
+        for handler in self._flush_handlers:
+            try:
+                result = handler()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Invalidation flush handler failed")
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation payload: %r", payload)
+            return
+
+        if event.get("o") == self.origin:
+            return
+
+        self.received += 1
+        self.dispatch(event["e"], event["i"], event.get("g") or 0)
+
+    # ---------------------------------------------------------
+    # LISTENER TASK
+    # ---------------------------------------------------------
+    async def run(self):
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener disconnected, reconnecting")
+
+            self.reconnects += 1
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen_once(self):
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+
+        try:
+            await connection.add_listener(self.channel, self._on_notify)
+
+            # Anything published while we were not listening is gone; rebuild
+            # from the DB now that LISTEN is active (later events still apply)
+            await self.flush()
+
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), timeout=self.health_check_interval)
+                except asyncio.TimeoutError:
+                    # Idle connections can die silently; probe them
+                    await asyncio.wait_for(connection.fetchval("SELECT 1"), timeout=5)
+        finally:
+            if not connection.is_closed():
+                await connection.close(timeout=5)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "published": self.published,
+            "received": self.received,
+            "flushes": self.flushes,
+            "reconnects": self.reconnects,
+        }
+
+
+invalidation_bus = InvalidationBus(
+    dsn=settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql").replace("postgresql+psycopg2", "postgresql"),
+    channel=settings.INVALIDATION_BUS_CHANNEL,
+    enabled=settings.INVALIDATION_BUS_ENABLED,
+)
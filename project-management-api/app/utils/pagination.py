@@ -1,6 +1,18 @@
 # app/utils/pagination.py
 
+import base64
+import json
+from datetime import datetime
 from math import ceil
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, text, tuple_
+
+from app.config import get_settings
+
+
+settings = get_settings()
 
 def paginate(page: int = 1, limit: int = 20):
     """
@@ -18,15 +30,228 @@ def paginate(page: int = 1, limit: int = 20):
     return skip, limit
 
 
-def build_pagination_metadata(page: int, limit: int, total: int):
+def build_pagination_metadata(
+    page: int,
+    limit: int,
+    total: int | None,
+    next_cursor: str | None = None,
+    prev_cursor: str | None = None,
+    has_more: bool | None = None,
+    count: str = "exact",
+    estimated: bool = False,
+    capped: bool = False,
+):
     """
-    Returns pagination metadata in the format required by the project spec.
+    Returns pagination metadata in the format required by the project spec,
+    plus the keyset cursors around the page and the count strategy used
+    (see below). total / pages are None with count="none"; with "estimated"
+    they are approximate, and `capped` marks total as a lower bound ("10,000+").
     """
-    total_pages = ceil(total / limit) if limit > 0 else 1
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = ceil(total / limit) if limit > 0 else 1
+
+    if has_more is None and total_pages is not None:
+        has_more = page < total_pages
 
     return {
         "page": page,
         "limit": limit,
         "total": total,
         "pages": total_pages,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+        "has_more": has_more,
+        "count": count,
+        "estimated": estimated,
+        "capped": capped,
     }
+
+
+# ---------------------------------------------------------
+# KEYSET (CURSOR) PAGINATION
+# Lists are ordered newest first by (created_at, id). A cursor is an opaque
+# token for one row's (created_at, id): "next" continues after it, "prev"
+# returns the rows just before it. Unlike OFFSET, it costs one index seek
+# at any depth and does not shift when rows are inserted.
+# ---------------------------------------------------------
+def encode_cursor(created_at: datetime, row_id, backwards: bool = False) -> str:
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(row_id), "b": backwards})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Returns (created_at, id, backwards); 400 on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["c"]), UUID(data["i"]), bool(data.get("b"))
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_query(query, created_col, id_col, limit: int, cursor: str | None = None, skip: int = 0):
+    """
+    Order `query` by (created_at, id) and fetch one extra row (to detect more).
+    With a cursor, seek past it instead of applying `skip`.
+
+    Returns (query, backwards); pass `backwards` on to `keyset_window`.
+    """
+    backwards = False
+    if cursor:
+        created_at, row_id, backwards = decode_cursor(cursor)
+        key, bound = tuple_(created_col, id_col), tuple_(created_at, row_id)
+        query = query.where(key > bound if backwards else key < bound)
+    else:
+        query = query.offset(skip)
+
+    if backwards:
+        query = query.order_by(created_col.asc(), id_col.asc())
+    else:
+        query = query.order_by(created_col.desc(), id_col.desc())
+
+    return query.limit(limit + 1), backwards
+
+
+def keyset_window(rows, limit: int, backwards: bool, has_previous: bool, key=lambda row: row):
+    """
+    Trim the extra row and build the cursors around this page.
+
+    `has_previous`: whether rows exist before this page when walking forwards
+    (a cursor or OFFSET was used). `key(row)` gives the object carrying
+    created_at / id. Returns (rows, next_cursor, prev_cursor, has_more), where
+    has_more means rows exist after this page (walking forwards).
+    """
+    rows = list(rows)
+    extra = len(rows) > limit
+    rows = rows[:limit]
+
+    if backwards:
+        rows.reverse()
+        has_next, has_prev = True, extra
+    else:
+        has_next, has_prev = extra, has_previous
+
+    if not rows:
+        return rows, None, None, False
+
+    first, last = key(rows[0]), key(rows[-1])
+    next_cursor = encode_cursor(last.created_at, last.id) if has_next else None
+    prev_cursor = encode_cursor(first.created_at, first.id, backwards=True) if has_prev else None
+    return rows, next_cursor, prev_cursor, has_next
+
+
+# ---------------------------------------------------------
+# COUNT STRATEGIES
+# exact:     a separate COUNT(*), which an unfiltered list answers with an
+#            index-only scan while the page query stops after LIMIT rows.
+#            Filtered or ranked lists use count(*) OVER () on the page query
+#            instead (one round trip): the filtered set is small, or (ranked)
+#            has to be read in full for the sort anyway. Past the last page
+#            the window sees no rows, so a COUNT runs there too.
+# estimated: planner statistics (pg_class.reltuples) when unfiltered,
+#            otherwise a count capped at COUNT_ESTIMATE_CAP ("10,000+")
+# none:      no count at all; `has_more` comes from the extra row
+# ---------------------------------------------------------
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+async def estimate_count(db, entity, conditions) -> tuple[int, bool]:
+    """Returns (total, is_lower_bound)."""
+    if not conditions:
+        reltuples = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": entity.__tablename__},
+        )
+        # -1: never analyzed; partitioned parents keep no stats of their own
+        if reltuples is not None and reltuples > 0:
+            return int(reltuples), False
+
+    cap = settings.COUNT_ESTIMATE_CAP
+    bounded = select(entity.id).where(*conditions).limit(cap + 1).subquery()
+    total = await db.scalar(select(func.count()).select_from(bounded))
+    return (cap, True) if total > cap else (total, False)
+
+
+async def fetch_page(
+    db,
+    entity,
+    conditions: list,
+    page: int = 1,
+    limit: int = 20,
+    cursor: str | None = None,
+    count: str = "exact",
+    rank=None,
+    columns: tuple = (),
+    fields: tuple = (),
+):
+    """
+    Run one page of `select(entity, *columns).where(*conditions)`.
+
+    Newest first by (created_at, id) with keyset cursors. A search `rank`
+    orders by relevance instead; that order has no keyset, so those pages
+    go by OFFSET and carry no cursors (unless the caller passed one).
+
+    With `fields` (entity columns, see app/utils/records.py) only those
+    columns are selected, plus created_at / id for the cursors, and no ORM
+    objects are built.
+
+    Returns (rows, pagination) with rows as Row objects whose first element
+    is the entity (or whose named elements are `fields` / `columns`), and
+    pagination from build_pagination_metadata.
+    """
+    skip, limit = paginate(page, limit)
+    if count not in COUNT_MODES:
+        count = "exact"
+
+    # Inside the page query only when the page covers the whole filtered set
+    # (a cursor adds its own WHERE) and the window is cheaper than a separate
+    # COUNT: over an unfiltered list it would defeat the LIMIT early stop
+    windowed = count == "exact" and not cursor and (bool(conditions) or rank is not None)
+
+    created_col, id_col = entity.created_at, entity.id
+    if fields:
+        selected = {col.key for col in fields}
+        keys = tuple(col for col in (created_col, id_col) if col.key not in selected)
+        query = select(*fields, *keys, *columns)
+        key = lambda row: row
+    else:
+        query = select(entity, *columns)
+        key = lambda row: row[0]
+
+    if windowed:
+        query = query.add_columns(func.count().over().label("total_count"))
+    query = query.where(*conditions)
+
+    if rank is not None and not cursor:
+        result = await db.execute(
+            query.order_by(rank.desc(), created_col.desc(), id_col.desc()).offset(skip).limit(limit + 1)
+        )
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows, next_cursor, prev_cursor = rows[:limit], None, None
+    else:
+        query, backwards = keyset_query(query, created_col, id_col, limit, cursor, skip)
+        result = await db.execute(query)
+        rows, next_cursor, prev_cursor, has_more = keyset_window(
+            result.all(), limit, backwards, bool(cursor) or skip > 0, key=key
+        )
+
+    total, estimated, capped = None, False, False
+    if count == "exact":
+        if windowed and rows:
+            total = rows[0].total_count
+        elif windowed and skip == 0:
+            total = 0
+        else:
+            total = await db.scalar(select(func.count()).select_from(entity).where(*conditions))
+    elif count == "estimated":
+        total, capped = await estimate_count(db, entity, conditions)
+        estimated = True
+
+    pagination = build_pagination_metadata(
+        page, limit, total, next_cursor, prev_cursor,
+        has_more=has_more, count=count, estimated=estimated, capped=capped,
+    )
+    return rows, pagination
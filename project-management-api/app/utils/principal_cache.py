@@ -0,0 +1,129 @@
+# app/utils/principal_cache.py
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from app.config import get_settings
+from app.models.user import User
+
+
+settings = get_settings()
+
+
+class PrincipalCache:
+    """
+    Bounded, TTL-evicting cache of resolved principals.
+
+    Maps session_id -> snapshot of the session owner's user row, so that
+    get_current_user can skip the Session + User lookups on a hit.
+    Only active sessions are ever stored.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[str, tuple[float, str, dict]] = OrderedDict()
+        self._sessions_by_user: dict[str, set[str]] = {}
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    # ---------------------------------------------------------
+    # LOOKUP
+    # ---------------------------------------------------------
+    def get(self, session_id) -> User | None:
+        if not self.enabled:
+            return None
+
+        key = str(session_id)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, _, snapshot = entry
+            if expires_at <= now:
+                self._drop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Hand out a fresh transient instance so requests never share state
+        return User(**snapshot)
+
+    def put(self, session_id, user: User):
+        if not self.enabled:
+            return
+
+        key = str(session_id)
+        user_key = str(user.id)
+        snapshot = {c.key: getattr(user, c.key) for c in User.__table__.columns}
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, user_key, snapshot)
+            self._sessions_by_user.setdefault(user_key, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    # ---------------------------------------------------------
+    # INVALIDATION
+    # ---------------------------------------------------------
+    def invalidate_session(self, session_id):
+        with self._lock:
+            self._drop(str(session_id))
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for key in list(self._sessions_by_user.get(str(user_id), ())):
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sessions_by_user.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_key = entry[1]
+        sessions = self._sessions_by_user.get(user_key)
+        if sessions is not None:
+            sessions.discard(key)
+            if not sessions:
+                del self._sessions_by_user[user_key]
+
+
+# Process-wide singleton used by get_current_user and the invalidation points
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
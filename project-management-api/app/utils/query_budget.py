@@ -0,0 +1,231 @@
+# app/utils/query_budget.py
+
+import logging
+import time
+from collections import deque
+from threading import Lock
+
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+
+from app.config import get_settings
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# SQLSTATE query_canceled (statement_timeout fired)
+QUERY_CANCELED = "57014"
+
+MAX_SQL_CHARS = 500
+
+
+class QueryBudget:
+    """One request's database allowance, shared by every session it opens."""
+
+    __slots__ = ("route", "statement_timeout_ms", "max_queries", "max_ms", "queries", "elapsed_ms", "reported")
+
+    def __init__(self, route: str, statement_timeout_ms: int | None, max_queries: int, max_ms: float):
+        self.route = route
+        # None: the connection-level default applies, no SET LOCAL needed
+        self.statement_timeout_ms = statement_timeout_ms
+        self.max_queries = max_queries
+        self.max_ms = max_ms
+        self.queries = 0
+        self.elapsed_ms = 0.0
+        self.reported: set[str] = set()
+
+    def exceeded(self) -> str | None:
+        if self.max_queries and self.queries > self.max_queries:
+            return "queries"
+        if self.max_ms and self.elapsed_ms > self.max_ms:
+            return "time"
+        return None
+
+
+class QueryBudgets:
+    """
+    Per-route statement timeouts and per-request query budgets.
+
+    - Statement timeout: DB_STATEMENT_TIMEOUT_MS for every connection, or a
+      DB_ROUTE_STATEMENT_TIMEOUTS override ("GET /api/v1/stats" style keys,
+      longest prefix wins; a bare path prefix covers a whole router), applied
+      with SET LOCAL at the start of each transaction (see app/database.py).
+    - Budget: number of queries and total query time per request, counted by
+      cursor-execute hooks through connection.info. Over budget, the route
+      and offending SQL are logged and recorded; with
+      DB_QUERY_BUDGET_ACTION="cancel" the next statement fails with a 503.
+    """
+
+    def __init__(
+        self,
+        default_timeout_ms: int = 0,
+        route_timeouts: dict | None = None,
+        max_queries: int = 0,
+        max_ms: float = 0,
+        action: str = "log",
+        connection_default: bool = True,
+        keep: int = 50,
+    ):
+        self.default_timeout_ms = default_timeout_ms
+        self.route_timeouts = sorted((route_timeouts or {}).items(), key=lambda kv: len(kv[0]), reverse=True)
+        self.max_queries = max_queries
+        self.max_ms = max_ms
+        self.cancel = action.lower() == "cancel"
+        # False behind PgBouncer: startup parameters are not passed through,
+        # so even the default has to be SET LOCAL per transaction
+        self.connection_default = connection_default
+
+        self._lock = Lock()
+        self.recent = deque(maxlen=keep)
+        self.by_route: dict[str, dict] = {}
+
+        self.budgeted_requests = 0
+        self.violations = 0
+        self.cancelled = 0
+        self.statement_timeouts = 0
+
+    # ---------------------------------------------------------
+    # PER REQUEST
+    # ---------------------------------------------------------
+    def statement_timeout_for(self, method: str, path: str) -> int:
+        label = f"{method} {path}"
+        for key, timeout_ms in self.route_timeouts:
+            if label.startswith(key) or path.startswith(key):
+                return timeout_ms
+        return self.default_timeout_ms
+
+    def for_request(self, request: Request) -> QueryBudget:
+        budget = getattr(request.state, "query_budget", None)
+        if budget is not None:
+            return budget
+
+        # Route template ("/api/v1/tasks/{task_id}"), so ids don't split the stats
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or request.url.path
+
+        timeout_ms = self.statement_timeout_for(request.method, path)
+        if timeout_ms == self.default_timeout_ms and (self.connection_default or not timeout_ms):
+            timeout_ms = None
+
+        budget = QueryBudget(f"{request.method} {path}", timeout_ms, self.max_queries, self.max_ms)
+        request.state.query_budget = budget
+        self.budgeted_requests += 1
+        return budget
+
+    def connect_args(self) -> dict:
+        """asyncpg startup settings carrying the default statement timeout."""
+        if not (self.connection_default and self.default_timeout_ms):
+            return {}
+        return {"server_settings": {"statement_timeout": str(self.default_timeout_ms)}}
+
+    # ---------------------------------------------------------
+    # REPORTING
+    # ---------------------------------------------------------
+    def _route_stats(self, route: str) -> dict:
+        stats = self.by_route.get(route)
+        if stats is None:
+            stats = self.by_route[route] = {"queries": 0, "time": 0, "statement_timeout": 0}
+        return stats
+
+    def report(self, budget: QueryBudget, kind: str, statement: str):
+        if kind in budget.reported:
+            return
+        budget.reported.add(kind)
+
+        sql = " ".join(statement.split())[:MAX_SQL_CHARS]
+        with self._lock:
+            if kind == "statement_timeout":
+                self.statement_timeouts += 1
+            else:
+                self.violations += 1
+            self._route_stats(budget.route)[kind] += 1
+            self.recent.append({
+                "route": budget.route,
+                "kind": kind,
+                "queries": budget.queries,
+                "elapsed_ms": round(budget.elapsed_ms, 1),
+                "sql": sql,
+                "at": time.time(),
+            })
+
+        logger.warning(
+            "%s on %s after %d queries / %.0f ms: %s",
+            kind, budget.route, budget.queries, budget.elapsed_ms, sql,
+        )
+
+    # ---------------------------------------------------------
+    # ENGINE HOOKS
+    # ---------------------------------------------------------
+    def instrument(self, engine):
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            budget = conn.info.get("query_budget")
+            if budget is None:
+                return
+
+            budget.queries += 1
+            kind = budget.exceeded()
+            if kind:
+                self.report(budget, kind, statement)
+                if self.cancel:
+                    self.cancelled += 1
+                    raise HTTPException(status_code=503, detail="Request exceeded its database budget")
+
+            conn.info["query_started"] = time.perf_counter()
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.pop("query_started", None)
+            budget = conn.info.get("query_budget")
+            if budget is None or started is None:
+                return
+
+            budget.elapsed_ms += (time.perf_counter() - started) * 1000
+            if budget.max_ms and budget.elapsed_ms > budget.max_ms:
+                self.report(budget, "time", statement)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _statement_timeout(context):
+            if getattr(context.original_exception, "sqlstate", None) != QUERY_CANCELED:
+                return None
+
+            conn = context.connection
+            budget = conn.info.get("query_budget") if conn is not None else None
+            if budget is not None:
+                conn.info.pop("query_started", None)
+                self.report(budget, "statement_timeout", context.statement or "")
+            return HTTPException(status_code=503, detail="Database statement timed out")
+
+        @event.listens_for(sync_engine.pool, "checkin")
+        def _release(dbapi_connection, connection_record):
+            # The budget belongs to the request, not to the pooled connection
+            if connection_record is not None:
+                connection_record.info.pop("query_budget", None)
+                connection_record.info.pop("query_started", None)
+
+    def stats(self) -> dict:
+        return {
+            "default_statement_timeout_ms": self.default_timeout_ms,
+            "max_queries": self.max_queries,
+            "max_ms": self.max_ms,
+            "action": "cancel" if self.cancel else "log",
+            "budgeted_requests": self.budgeted_requests,
+            "violations": self.violations,
+            "cancelled": self.cancelled,
+            "statement_timeouts": self.statement_timeouts,
+            "by_route": dict(self.by_route),
+            "recent": list(self.recent),
+        }
+
+
+query_budgets = QueryBudgets(
+    default_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+    route_timeouts=settings.DB_ROUTE_STATEMENT_TIMEOUTS,
+    max_queries=settings.DB_QUERY_BUDGET_COUNT,
+    max_ms=settings.DB_QUERY_BUDGET_MS,
+    action=settings.DB_QUERY_BUDGET_ACTION,
+    connection_default=not settings.DB_PGBOUNCER_COMPAT,
+)
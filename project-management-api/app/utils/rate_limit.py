@@ -0,0 +1,130 @@
+# app/utils/rate_limit.py
+
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Protocol
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+
+
+settings = get_settings()
+
+
+class BucketBackend(Protocol):
+    """Storage for token buckets. Swap in a shared (e.g. Redis) backend for fleet-wide limits."""
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Consume one token; returns 0 if allowed, else seconds until a token is available."""
+        ...
+
+
+class MemoryBucketBackend:
+    """
+    Per-process token buckets in an LRU-bounded map.
+
+    When `max_keys` is reached the least recently used bucket is evicted;
+    an evicted key simply starts again with a full bucket.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = Lock()
+        self.evictions = 0
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - updated_at) * rate)
+
+            if tokens >= 1:
+                wait = 0.0
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+
+        return wait
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class LoginThrottle:
+    """
+    Token-bucket throttle for /auth/login, keyed by client IP and by email.
+
+    Runs before UserService.authenticate so an over-budget caller costs
+    neither SQL nor bcrypt.
+    """
+
+    def __init__(
+        self,
+        backend: BucketBackend,
+        ip_per_minute: float = 30,
+        ip_burst: int = 10,
+        email_per_minute: float = 10,
+        email_burst: int = 5,
+    ):
+        self.backend = backend
+        self.ip_rate = ip_per_minute / 60
+        self.ip_burst = ip_burst
+        self.email_rate = email_per_minute / 60
+        self.email_burst = email_burst
+
+        self.allowed = 0
+        self.rejected_ip = 0
+        self.rejected_email = 0
+
+    async def check(self, ip: str, email: str):
+        wait = await self.backend.take(f"login:ip:{ip}", self.ip_rate, self.ip_burst)
+        if wait:
+            self.rejected_ip += 1
+            self._reject(wait)
+
+        wait = await self.backend.take(f"login:email:{email.strip().lower()}", self.email_rate, self.email_burst)
+        if wait:
+            self.rejected_email += 1
+            self._reject(wait)
+
+        self.allowed += 1
+
+    @staticmethod
+    def _reject(wait: float):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(max(1, math.ceil(wait)))},
+        )
+
+    def stats(self) -> dict:
+        stats = {
+            "allowed": self.allowed,
+            "rejected_ip": self.rejected_ip,
+            "rejected_email": self.rejected_email,
+        }
+        if isinstance(self.backend, MemoryBucketBackend):
+            stats["buckets"] = len(self.backend)
+            stats["evictions"] = self.backend.evictions
+        return stats
+
+
+login_throttle = LoginThrottle(
+    backend=MemoryBucketBackend(max_keys=settings.LOGIN_THROTTLE_MAX_KEYS),
+    ip_per_minute=settings.LOGIN_RATE_PER_IP_PER_MINUTE,
+    ip_burst=settings.LOGIN_BURST_PER_IP,
+    email_per_minute=settings.LOGIN_RATE_PER_EMAIL_PER_MINUTE,
+    email_burst=settings.LOGIN_BURST_PER_EMAIL,
+)
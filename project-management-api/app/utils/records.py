@@ -0,0 +1,127 @@
+# app/utils/records.py
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from operator import itemgetter
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+
+# ---------------------------------------------------------
+# CORE-ROW READ PATH
+# List endpoints select only the columns of their list schema (or of a
+# ?fields= fieldset, below) and get back
+# Core Row objects (plain tuples with named access: no identity map, no
+# attribute instrumentation, no lazy loaders). Those rows are serialized
+# here straight to JSON, skipping the per-object response_model validation.
+# The schema stays on the route for the OpenAPI docs and the field names.
+# ---------------------------------------------------------
+def entity_columns(entity, names) -> tuple:
+    """Mapped columns of `entity` for `names`, in order; non-column names are skipped."""
+    table_columns = entity.__table__.c
+    return tuple(getattr(entity, name) for name in names if name in table_columns)
+
+
+def schema_columns(entity, schema) -> tuple:
+    """Mapped columns of `entity` named by `schema`'s fields, in schema order."""
+    return entity_columns(entity, schema.model_fields)
+
+
+# ---------------------------------------------------------
+# SPARSE FIELDSETS (?fields=id,title,status)
+# The same names pick the SQL columns and the JSON keys, so dropping a
+# field (e.g. the unbounded description) shrinks both.
+# ---------------------------------------------------------
+def parse_fields(fields: str | None, allowed: tuple, default: tuple) -> tuple:
+    """
+    Comma-separated `fields` -> tuple of names, checked against `allowed`
+    (400 on anything else). `id` is always included; no `fields` -> `default`.
+    """
+    if not fields:
+        return default
+
+    names = dict.fromkeys(["id", *(name.strip() for name in fields.split(",") if name.strip())])
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}",
+        )
+    return tuple(names)
+
+
+def to_records(rows, names) -> list[dict]:
+    """
+    Rows -> list of dicts with exactly `names` as keys. Names the rows do not
+    carry (e.g. `snippet` outside a search) come out as None, like the
+    schema default would.
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+
+    fields = rows[0]._fields
+    present = [name for name in names if name in fields]
+    missing = {name: None for name in names if name not in fields}
+
+    if len(present) == 1:
+        index = fields.index(present[0])
+        return [{present[0]: row[index], **missing} for row in rows]
+
+    getter = itemgetter(*(fields.index(name) for name in present))
+    return [{**dict(zip(present, getter(row))), **missing} for row in rows]
+
+
+def _encode(value):
+    # Same wire format as the pydantic models: UTC as "Z", enums by value
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.tzinfo is timezone.utc:
+            text = text[:-6] + "Z"
+        return text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RecordsResponse(JSONResponse):
+    """JSONResponse whose body is encoded by the C json encoder plus `_encode`."""
+
+    def render(self, content) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_encode,
+        ).encode("utf-8")
+
+
+def _names(fields) -> tuple:
+    # A fieldset (tuple of names) or a pydantic schema
+    return tuple(getattr(fields, "model_fields", fields))
+
+
+def records_response(message: str, rows, fields, pagination=None) -> RecordsResponse:
+    """The `{message, data, pagination}` list envelope, built from Core rows."""
+    return RecordsResponse({
+        "message": message,
+        "data": to_records(rows, _names(fields)),
+        "pagination": pagination,
+    })
+
+
+def record_response(message: str, row, fields) -> RecordsResponse:
+    """The `{message, data}` detail envelope, built from one Core row."""
+    return RecordsResponse({
+        "message": message,
+        "data": to_records([row], _names(fields))[0],
+    })
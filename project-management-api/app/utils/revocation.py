@@ -0,0 +1,88 @@
+# app/utils/revocation.py
+"""
+Single place to call when a change must cut off access.
+
+Call the helpers BEFORE `db.commit()`: they store the revocation epoch in
+token_revocations and notify the other workers in the same transaction,
+and evict this worker's principal cache / epoch table once it commits.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal, after_commit
+from app.models.token_revocation import TokenRevocation
+from app.utils.invalidation_bus import invalidation_bus
+from app.utils.principal_cache import principal_cache
+from app.utils.session_epochs import now_ms, session_epochs
+
+
+settings = get_settings()
+
+
+def _evict_session(session_id, generation: int | None = None):
+    principal_cache.invalidate_session(session_id)
+    session_epochs.revoke_session(session_id, generation or now_ms())
+
+
+def _evict_user(user_id, generation: int | None = None):
+    principal_cache.invalidate_user(user_id)
+    session_epochs.revoke_user(user_id, generation or now_ms())
+
+
+def _store_epoch(kind: str, subject_id, epoch_ms: int):
+    """Upsert the epoch; it only moves forward, and is kept for one token lifetime."""
+    expires_at = datetime.fromtimestamp((epoch_ms + session_epochs.token_ttl_ms) / 1000, timezone.utc)
+    stmt = pg_insert(TokenRevocation).values(
+        kind=kind, subject_id=subject_id, epoch_ms=epoch_ms, expires_at=expires_at
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[TokenRevocation.kind, TokenRevocation.subject_id],
+        set_={
+            "epoch_ms": func.greatest(TokenRevocation.epoch_ms, stmt.excluded.epoch_ms),
+            "expires_at": func.greatest(TokenRevocation.expires_at, stmt.excluded.expires_at),
+        },
+    )
+
+
+async def revoke_session(db: AsyncSession, session_id):
+    epoch = now_ms()
+    if settings.ACCESS_TOKEN_MODE == "stateless":
+        await db.execute(_store_epoch("session", session_id, epoch))
+    await invalidation_bus.publish(db, "session", session_id, epoch)
+    after_commit(db, lambda: _evict_session(session_id, epoch))
+
+
+async def revoke_user(db: AsyncSession, user_id):
+    """Session logout-all, role change, disable or profile update."""
+    epoch = now_ms()
+    if settings.ACCESS_TOKEN_MODE == "stateless":
+        await db.execute(_store_epoch("user", user_id, epoch))
+    await invalidation_bus.publish(db, "user", user_id, epoch)
+    after_commit(db, lambda: _evict_user(user_id, epoch))
+
+
+async def load_revocations() -> int:
+    """Copy the unexpired token_revocations rows into this worker's epoch table."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(TokenRevocation.kind, TokenRevocation.subject_id, TokenRevocation.epoch_ms)
+            .where(TokenRevocation.expires_at > func.now())
+        )
+        rows = result.all()
+
+    for kind, subject_id, epoch_ms in rows:
+        session_epochs.apply(kind, subject_id, epoch_ms)
+    return len(rows)
+
+
+# Events from other workers
+invalidation_bus.subscribe("session", _evict_session)
+invalidation_bus.subscribe("user", _evict_user)
+# Missed events: drop cached principals, re-read the shared epochs
+invalidation_bus.on_flush(principal_cache.clear)
+invalidation_bus.on_flush(load_revocations)
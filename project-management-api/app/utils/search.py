@@ -0,0 +1,73 @@
+# app/utils/search.py
+
+import re
+from typing import NamedTuple, Optional
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import get_settings
+
+
+settings = get_settings()
+
+# Must match the text search config of the generated search_vector columns
+# (migration 7d1e4b9c3a52)
+TS_CONFIG = "english"
+
+HEADLINE_OPTIONS = "MaxFragments=1, MaxWords=20, MinWords=5, StartSel=<b>, StopSel=</b>"
+
+# ts_headline copies the source text through unescaped, so it is
+# HTML-escaped first: the only markup in a snippet is then our <b></b>.
+# "&" goes first so the other replacements are not escaped twice.
+HTML_ESCAPES = [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#39;")]
+
+WORD = re.compile(r"[^\W_]+")
+
+
+class SearchClause(NamedTuple):
+    condition: ColumnElement
+    rank: Optional[ColumnElement] = None    # ORDER BY rank DESC when set
+    snippet: Optional[ColumnElement] = None
+
+
+def _html_escape(text: ColumnElement) -> ColumnElement:
+    for char, entity in HTML_ESCAPES:
+        text = func.replace(text, char, entity)
+    return text
+
+
+def _like(term: str, columns) -> ColumnElement:
+    like = f"%{term.lower()}%"
+    return or_(*(func.lower(col).like(like) for col in columns))
+
+
+def build_search(term: str, vector, columns, mode: str | None = None) -> SearchClause:
+    """
+    WHERE / rank / snippet for a `search` query parameter.
+
+    - "fts":     prefix full-text match on the GIN-indexed `vector`
+                 (every word must match, "des" finds "design"), ranked by
+                 ts_rank, with a highlighted ts_headline snippet (HTML-safe)
+    - "trigram": substring match served by the pg_trgm GIN index, ranked by similarity
+    - "like":    plain lower(col) LIKE '%term%' (unindexed)
+    """
+    mode = (mode or settings.SEARCH_MODE).lower()
+
+    if mode == "trigram":
+        term = term.lower()
+        rank = func.greatest(*(func.similarity(func.lower(func.coalesce(col, "")), term) for col in columns))
+        return SearchClause(_like(term, columns), rank)
+
+    words = WORD.findall(term.lower())
+    if mode != "fts" or not words:
+        return SearchClause(_like(term, columns))
+
+    query = func.to_tsquery(TS_CONFIG, " & ".join(f"{word}:*" for word in words))
+    return SearchClause(
+        condition=vector.op("@@")(query),
+        rank=func.ts_rank(vector, query),
+        snippet=func.ts_headline(
+            TS_CONFIG, _html_escape(func.concat_ws(" — ", *columns)), query, HEADLINE_OPTIONS
+        ),
+    )
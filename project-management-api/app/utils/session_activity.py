@@ -0,0 +1,123 @@
+# app/utils/session_activity.py
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import TIMESTAMP, column, or_, update, values
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.session import Session
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class SessionActivityTracker:
+    """
+    Write-behind tracking of Session.last_used_at.
+
+    get_current_user calls `record()` (in-memory, deduplicated per session);
+    a background task flushes the set every `flush_interval` seconds with a
+    single `UPDATE sessions ... FROM (VALUES ...)`.
+    """
+
+    def __init__(self, flush_interval: float = 10.0, max_pending: int = 50000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: dict[str, datetime] = {}
+
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+
+    # ---------------------------------------------------------
+    # RECORD
+    # ---------------------------------------------------------
+    def record(self, session_id, seen_at: datetime | None = None):
+        key = str(session_id)
+        seen_at = seen_at or datetime.now(timezone.utc)
+
+        previous = self._pending.get(key)
+        if previous is None and len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+
+        if previous is None or seen_at > previous:
+            self._pending[key] = seen_at
+
+    # ---------------------------------------------------------
+    # FLUSH
+    # ---------------------------------------------------------
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        started = time.perf_counter()
+
+        seen = values(
+            column("id", UUID(as_uuid=True)),
+            column("seen_at", TIMESTAMP(timezone=True)),
+            name="seen",
+        ).data(list(batch.items()))
+
+        stmt = (
+            update(Session.__table__)
+            .where(Session.id == seen.c.id)
+            .where(or_(Session.last_used_at.is_(None), Session.last_used_at < seen.c.seen_at))
+            .values(last_used_at=seen.c.seen_at)
+        )
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception:
+            self.errors += 1
+            logger.exception("Flushing %d session activity rows failed", len(batch))
+            # Put the batch back, keeping anything newer recorded meanwhile
+            for key, seen_at in batch.items():
+                self.record(key, seen_at)
+            return 0
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        self.rows_flushed += len(batch)
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        return len(batch)
+
+    async def run(self):
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        finally:
+            # Best effort on shutdown
+            await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+
+session_activity = SessionActivityTracker(
+    flush_interval=settings.SESSION_ACTIVITY_FLUSH_SECONDS,
+    max_pending=settings.SESSION_ACTIVITY_MAX_PENDING,
+)
@@ -0,0 +1,78 @@
+# app/utils/session_epochs.py
+
+import time
+from threading import Lock
+
+from app.utils.auth import ACCESS_TOKEN_EXPIRE_MINUTES
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class SessionEpochTable:
+    """
+    This worker's copy of the revocation epochs for stateless access tokens.
+
+    - Stateless tokens carry their issue time in milliseconds ("iat_ms").
+    - Revoking a user or a single session records an epoch (also ms);
+      tokens of that user / session issued before it are rejected.
+    - The epochs live in the token_revocations table, written in the same
+      transaction as the change (see app/utils/revocation.py). This table
+      is only a cache of it: loaded on startup, kept current by the
+      invalidation bus, so every worker (and a restarted one) agrees.
+
+    An epoch can only reject tokens for one token lifetime, then it is dropped.
+    """
+
+    def __init__(self, token_ttl_seconds: int, max_entries: int = 100000):
+        self.token_ttl_ms = token_ttl_seconds * 1000
+        self.max_entries = max_entries
+
+        self._users: dict[str, int] = {}
+        self._sessions: dict[str, int] = {}
+        self._lock = Lock()
+
+    # ---------------------------------------------------------
+    # READ
+    # ---------------------------------------------------------
+    def accepts(self, user_id, session_id, issued_at_ms: int) -> bool:
+        return (
+            issued_at_ms >= self._users.get(str(user_id), 0)
+            and issued_at_ms >= self._sessions.get(str(session_id), 0)
+        )
+
+    # ---------------------------------------------------------
+    # WRITE
+    # ---------------------------------------------------------
+    def apply(self, kind: str, subject_id, epoch_ms: int):
+        """Record a stored epoch (a token_revocations row, or a bus event carrying one)."""
+        table = self._users if kind == "user" else self._sessions
+        key = str(subject_id)
+        with self._lock:
+            # Rows only ever move forward (GREATEST on upsert); never step back
+            if epoch_ms > table.get(key, 0):
+                table[key] = epoch_ms
+            if len(table) > self.max_entries:
+                self._prune(table)
+
+    def revoke_user(self, user_id, epoch_ms: int):
+        self.apply("user", user_id, epoch_ms)
+
+    def revoke_session(self, session_id, epoch_ms: int):
+        self.apply("session", session_id, epoch_ms)
+
+    def _prune(self, table: dict):
+        # Tokens issued before these epochs have expired anyway
+        cutoff = now_ms() - self.token_ttl_ms
+        for key in [k for k, v in table.items() if v < cutoff]:
+            del table[key]
+
+    def stats(self) -> dict:
+        return {
+            "user_epochs": len(self._users),
+            "session_epochs": len(self._sessions),
+        }
+
+
+session_epochs = SessionEpochTable(token_ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
@@ -0,0 +1,280 @@
+# app/utils/session_reaper.py
+
+import asyncio
+import logging
+import re
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.config import get_settings
+from app.database import engine
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant: only one worker in the fleet reaps at a time
+REAPER_LOCK_KEY = 0x5E55_1095
+
+PARTITION_NAME = re.compile(r"^sessions_p(\d{4})(\d{2})$")
+
+# Rows past retention: expired, or logged out / inactive, before :cutoff.
+# Each half matches an index (migration c6f1e8a3d920), so the batched
+# deletes walk one index per pass instead of rescanning the table.
+EXPIRED = "refresh_token_expires_at < :cutoff"
+INACTIVE = "is_active IS NOT TRUE AND coalesce(last_used_at, created_at) < :cutoff"
+RETENTION_EXPIRED = f"coalesce({EXPIRED}, false) OR ({INACTIVE})"
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+
+class SessionReaper:
+    """
+    Retention for the (partitioned) sessions table.
+
+    Each run, holding a fleet-wide advisory lock:
+    1. creates the monthly partitions for the next `months_ahead` months;
+    2. drops whole monthly partitions older than `partition_retention_months`
+       once every row in them is past retention (see 3);
+    3. deletes sessions that expired, or went inactive, more than
+       `retention_days` ago in bounded batches (admins can still list
+       recently logged-out sessions);
+    4. deletes token_revocations rows whose tokens have all expired.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 3600,
+        batch_size: int = 5000,
+        max_batches: int = 100,
+        retention_days: int = 30,
+        partition_retention_months: int = 3,
+        months_ahead: int = 3,
+    ):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.retention_days = retention_days
+        self.partition_retention_months = partition_retention_months
+        self.months_ahead = months_ahead
+
+        self.runs = 0
+        self.rows_deleted = 0
+        self.revocations_deleted = 0
+        self.partitions_created = 0
+        self.partitions_dropped = 0
+        self.last_run_ms = 0.0
+
+    # ---------------------------------------------------------
+    # RUN
+    # ---------------------------------------------------------
+    async def run_once(self):
+        started = time.perf_counter()
+
+        async with engine.connect() as conn:
+            locked = await conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": REAPER_LOCK_KEY})
+            await conn.commit()
+            if not locked:
+                return
+
+            try:
+                partitioned = await conn.scalar(text(
+                    "SELECT relkind = 'p' FROM pg_class WHERE oid = 'sessions'::regclass"
+                ))
+                if partitioned:
+                    await self._ensure_partitions(conn)
+                    await self._drop_old_partitions(conn)
+                await self._delete_batches(conn)
+                await self._delete_expired_revocations(conn)
+            finally:
+                # Also on failure / cancellation: shielded so a second cancel
+                # cannot interrupt it halfway
+                await asyncio.shield(self._unlock(conn))
+
+        self.runs += 1
+        self.last_run_ms = (time.perf_counter() - started) * 1000
+
+    async def ensure_partitions(self):
+        """
+        Create this month's and the upcoming partitions. Runs at every
+        startup, reaper enabled or not: sessions has no DEFAULT partition
+        (migration c6f1e8a3d920), so an insert for a missing month fails.
+        """
+        async with engine.connect() as conn:
+            partitioned = await conn.scalar(text(
+                "SELECT relkind = 'p' FROM pg_class WHERE oid = 'sessions'::regclass"
+            ))
+            await conn.commit()
+            if partitioned:
+                await self._ensure_partitions(conn)
+
+    async def _unlock(self, conn):
+        try:
+            # An error leaves the transaction aborted; the unlock would fail
+            await conn.rollback()
+            await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": REAPER_LOCK_KEY})
+            await conn.commit()
+        except BaseException:
+            # The lock belongs to the DB session: closing the connection
+            # (instead of returning it to the pool) releases it
+            await conn.invalidate()
+            raise
+
+    async def run(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Session reaper run failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    # ---------------------------------------------------------
+    # PARTITIONS
+    # ---------------------------------------------------------
+    async def _existing_partitions(self, conn) -> list[str]:
+        result = await conn.execute(text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'sessions'::regclass
+        """))
+        return [row[0] for row in result]
+
+    async def _has_default_partition(self, conn) -> bool:
+        return await conn.scalar(text(
+            "SELECT partdefid <> 0 FROM pg_partitioned_table WHERE partrelid = 'sessions'::regclass"
+        ))
+
+    async def _detach(self, conn, name: str, pending: bool):
+        """
+        DETACH PARTITION CONCURRENTLY (PG14+) only takes a SHARE UPDATE
+        EXCLUSIVE lock on sessions, so logins keep inserting meanwhile. It
+        cannot run in a transaction block, hence the AUTOCOMMIT connection,
+        and is refused while a DEFAULT partition exists: then fall back to
+        a plain DETACH that gives up quickly instead of queueing traffic.
+        """
+        if await self._has_default_partition(conn):
+            await conn.execute(text("SET LOCAL lock_timeout = '2s'"))
+            await conn.execute(text(f"ALTER TABLE sessions DETACH PARTITION {name}"))
+            return
+
+        # Close our transaction first: the concurrent detach waits for every
+        # transaction that could still see the partition
+        await conn.commit()
+        async with engine.connect() as autocommit:
+            autocommit = await autocommit.execution_options(isolation_level="AUTOCOMMIT")
+            # An interrupted concurrent detach leaves the partition pending
+            action = "FINALIZE" if pending else "CONCURRENTLY"
+            await autocommit.execute(text(f"ALTER TABLE sessions DETACH PARTITION {name} {action}"))
+
+    async def _ensure_partitions(self, conn):
+        existing = set(await self._existing_partitions(conn))
+        month = date.today().replace(day=1)
+
+        for _ in range(self.months_ahead + 1):
+            upper = _add_months(month, 1)
+            name = f"sessions_p{month:%Y%m}"
+            if name not in existing:
+                try:
+                    await conn.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF sessions "
+                        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+                    ))
+                    await conn.commit()
+                    self.partitions_created += 1
+                except Exception:
+                    # e.g. rows for that month already sit in sessions_default
+                    await conn.rollback()
+                    logger.exception("Could not create session partition %s", name)
+            month = upper
+
+    async def _drop_old_partitions(self, conn):
+        cutoff = _add_months(date.today().replace(day=1), -self.partition_retention_months)
+        retained_after = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+
+        pending = set((await conn.execute(text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'sessions'::regclass AND i.inhdetachpending
+        """))).scalars())
+
+        for name in await self._existing_partitions(conn):
+            match = PARTITION_NAME.match(name)
+            if not match:
+                continue
+
+            upper = _add_months(date(int(match.group(1)), int(match.group(2)), 1), 1)
+            if upper > cutoff:
+                continue
+
+            has_retained = await conn.scalar(text(f"""
+                SELECT EXISTS (
+                    SELECT 1 FROM {name}
+                    WHERE NOT ({RETENTION_EXPIRED})
+                )
+            """), {"cutoff": retained_after})
+            if has_retained:
+                continue
+
+            await self._detach(conn, name, name in pending)
+            await conn.execute(text(f"DROP TABLE {name}"))
+            await conn.commit()
+            self.partitions_dropped += 1
+
+    # ---------------------------------------------------------
+    # ROW DELETES
+    # ---------------------------------------------------------
+    async def _delete_batches(self, conn):
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+
+        # Each predicate has its own budget: an expired backlog must not
+        # starve the inactive pass
+        for predicate in (EXPIRED, INACTIVE):
+            for _ in range(self.max_batches):
+                result = await conn.execute(text(f"""
+                    DELETE FROM sessions
+                    WHERE (id, created_at) IN (
+                        SELECT id, created_at FROM sessions
+                        WHERE {predicate}
+                        LIMIT :batch_size
+                    )
+                """), {"cutoff": cutoff, "batch_size": self.batch_size})
+                await conn.commit()
+
+                self.rows_deleted += result.rowcount
+                if result.rowcount < self.batch_size:
+                    break
+
+                # Let autovacuum / other traffic breathe between batches
+                await asyncio.sleep(0.1)
+
+    async def _delete_expired_revocations(self, conn):
+        result = await conn.execute(text("DELETE FROM token_revocations WHERE expires_at < now()"))
+        await conn.commit()
+        self.revocations_deleted += result.rowcount
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "rows_deleted": self.rows_deleted,
+            "revocations_deleted": self.revocations_deleted,
+            "partitions_created": self.partitions_created,
+            "partitions_dropped": self.partitions_dropped,
+            "last_run_ms": round(self.last_run_ms, 2),
+        }
+
+
+session_reaper = SessionReaper(
+    interval_seconds=settings.SESSION_REAPER_INTERVAL_SECONDS,
+    batch_size=settings.SESSION_REAPER_BATCH_SIZE,
+    retention_days=settings.SESSION_RETENTION_DAYS,
+    partition_retention_months=settings.SESSION_PARTITION_RETENTION_MONTHS,
+)
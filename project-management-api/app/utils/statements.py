@@ -0,0 +1,74 @@
+# app/utils/statements.py
+
+from sqlalchemy import event, lambda_stmt, select
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+from app.database import engine
+from app.models.project import Project
+from app.models.session import Session
+from app.models.task import Task
+from app.models.user import User
+
+
+# ---------------------------------------------------------
+# HOT LOOKUPS
+# lambda_stmt caches the constructed statement per call site (the id becomes
+# a bound parameter), so these skip both statement construction and, through
+# the engine's compiled cache, SQL compilation. The SQL text is identical on
+# every call, so asyncpg reuses the same prepared statement per connection.
+# ---------------------------------------------------------
+def session_by_id(session_id):
+    return lambda_stmt(lambda: select(Session).where(Session.id == session_id))
+
+
+def user_by_id(user_id):
+    return lambda_stmt(lambda: select(User).where(User.id == user_id))
+
+
+def task_by_id(task_id):
+    return lambda_stmt(lambda: select(Task).where(Task.id == task_id))
+
+
+def project_by_id(project_id):
+    return lambda_stmt(lambda: select(Project).where(Project.id == project_id))
+
+
+# ---------------------------------------------------------
+# COMPILED-CACHE COUNTERS
+# ---------------------------------------------------------
+class CompiledCacheStats:
+    """Counts SQLAlchemy compiled-cache hits / misses for every statement on `engine`."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def observe(self, cache_hit):
+        if cache_hit is CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CACHE_MISS:
+            self.misses += 1
+        else:
+            # DDL, text(), or statements that opt out of caching
+            self.uncached += 1
+
+    def stats(self) -> dict:
+        cached = self.hits + self.misses
+        compiled_cache = engine.sync_engine._compiled_cache
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_rate": round(self.hits / cached, 4) if cached else None,
+            "cache_entries": len(compiled_cache) if compiled_cache is not None else 0,
+        }
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _count_compiled_cache(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        compiled_cache_stats.observe(getattr(context, "cache_hit", None))
@@ -0,0 +1,165 @@
+# app/utils/tokens.py
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from jose import jwt, JWTError
+
+from app.config import get_settings
+
+
+settings = get_settings()
+
+# Tokens minted before key rotation existed carry no "kid" header
+LEGACY_KID = "default"
+
+SYMMETRIC_ALGORITHMS = ("HS256", "HS384", "HS512")
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+
+
+class TokenVerifier:
+    """
+    Signs and verifies access tokens.
+
+    - Keys are selected by the "kid" header, so several keys can be active
+      at once: add the new key everywhere, switch the active kid, and drop
+      the old one after the last token signed with it has expired.
+    - Symmetric (HS*) mode: every key is a shared secret.
+      Asymmetric (RS*/ES*) mode: `keys` holds public keys only, so edge
+      workers can verify without being able to sign; `private_key` is only
+      needed where tokens are issued.
+    - Verified claims are memoised in a bounded LRU keyed by the token's
+      SHA-256, and never served past the token's `exp`.
+
+    Expiry itself is NOT enforced here: session-mode access tokens are
+    timeless by design, callers decide (see routers/auth).
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        keys: Dict[str, str],
+        active_kid: str,
+        private_key: Optional[str] = None,
+        cache_size: int = 10000,
+    ):
+        if algorithm not in SYMMETRIC_ALGORITHMS + ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
+
+        self.algorithm = algorithm
+        self.asymmetric = algorithm in ASYMMETRIC_ALGORITHMS
+        self.active_kid = active_kid
+        self.private_key = private_key
+        self.cache_size = cache_size
+
+        self._keys = dict(keys)
+        self._cache: OrderedDict[str, tuple[Optional[float], dict]] = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------------------------------------------------
+    # KEY MANAGEMENT
+    # ---------------------------------------------------------
+    def add_key(self, kid: str, key: str):
+        self._keys[kid] = key
+
+    def remove_key(self, kid: str):
+        self._keys.pop(kid, None)
+        self.clear_cache()
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    # ---------------------------------------------------------
+    # SIGN
+    # ---------------------------------------------------------
+    def sign(self, claims: Dict[str, Any]) -> str:
+        signing_key = self.private_key if self.asymmetric else self._keys.get(self.active_kid)
+        if not signing_key:
+            raise RuntimeError(f"No signing key available for kid '{self.active_kid}'")
+
+        return jwt.encode(
+            claims,
+            signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid},
+        )
+
+    # ---------------------------------------------------------
+    # VERIFY
+    # ---------------------------------------------------------
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Returns the verified claims or raises JWTError."""
+        digest = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None:
+                expires_at, claims = entry
+                if expires_at is None or expires_at > now:
+                    self._cache.move_to_end(digest)
+                    self.hits += 1
+                    return dict(claims)
+                del self._cache[digest]
+            self.misses += 1
+
+        claims = self._decode(token)
+
+        exp = claims.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else None
+        if expires_at is None or expires_at > now:
+            with self._lock:
+                self._cache[digest] = (expires_at, claims)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return dict(claims)
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        kid = jwt.get_unverified_header(token).get("kid") or LEGACY_KID
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key '{kid}'")
+
+        return jwt.decode(
+            token,
+            key,
+            algorithms=[self.algorithm],
+            options={"verify_exp": False},
+        )
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "active_kid": self.active_kid,
+            "kids": sorted(self._keys),
+        }
+
+
+def build_token_verifier() -> TokenVerifier:
+    keys = dict(settings.JWT_KEYS)
+
+    if settings.ALGORITHM in SYMMETRIC_ALGORITHMS:
+        # Keep verifying tokens signed with SECRET_KEY before rotation existed
+        keys.setdefault(LEGACY_KID, settings.SECRET_KEY)
+
+    return TokenVerifier(
+        algorithm=settings.ALGORITHM,
+        keys=keys,
+        active_kid=settings.JWT_ACTIVE_KID,
+        private_key=settings.JWT_PRIVATE_KEY,
+        cache_size=settings.JWT_VERIFY_CACHE_SIZE,
+    )
+
+
+token_verifier = build_token_verifier()
@@ -0,0 +1,34 @@
+# app/utils/writes.py
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# ---------------------------------------------------------
+# SINGLE ROUND-TRIP WRITES
+# INSERT / UPDATE ... RETURNING <every mapped column>: server defaults
+# (created_at, updated_at, generated columns) come back with the write, so
+# the caller commits and returns the entity without a follow-up refresh().
+# Sessions use expire_on_commit=False, so the loaded attributes survive the
+# commit.
+# ---------------------------------------------------------
+async def insert_returning(db: AsyncSession, model, **values):
+    """INSERT one row and return it as a persistent `model` instance."""
+    stmt = insert(model).values(**values).returning(model)
+    return (await db.scalars(stmt)).one()
+
+
+async def update_returning(db: AsyncSession, model, *where, **values):
+    """
+    UPDATE the rows matching `where` and return the first as a `model`
+    instance, or None when nothing matched. populate_existing overwrites
+    any copy already in the identity map with the returned row.
+    """
+    stmt = (
+        update(model)
+        .where(*where)
+        .values(**values)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    return (await db.scalars(stmt)).first()
@@ -0,0 +1,111 @@
+"""
+List endpoint read path: ORM entities + response_model vs Core rows.
+
+For each list (tasks, projects, users, sessions) and page size, times the
+page fetch and the JSON serialization of both paths against the seeded
+benchmark dataset (see scripts.seed_benchmark_data):
+
+- orm:  fetch_page(entity) -> ORM instances -> <List>Response validation
+        (from_attributes) -> JSON, as FastAPI's response_model does
+- core: fetch_page(fields=...) -> Core rows -> records_response()
+
+Usage:
+    python -m scripts.bench_list_reads [iterations]
+"""
+import asyncio
+import sys
+import time
+
+from app.database import AsyncSessionLocal, engine
+from app.models.project import Project
+from app.models.session import Session
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.response import (
+    ProjectListItem,
+    ProjectListResponse,
+    SessionListResponse,
+    SessionResponse,
+    TaskListItem,
+    TaskListResponse,
+    UserListItem,
+    UserListResponse,
+)
+from app.utils.pagination import fetch_page
+from app.utils.records import records_response, schema_columns
+
+
+PAGE_SIZES = [20, 50, 100]
+
+LISTS = [
+    ("tasks", Task, TaskListItem, TaskListResponse),
+    ("projects", Project, ProjectListItem, ProjectListResponse),
+    ("users", User, UserListItem, UserListResponse),
+    ("sessions", Session, SessionResponse, SessionListResponse),
+]
+
+
+async def orm_path(entity, item, envelope, limit: int):
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        rows, pagination = await fetch_page(db, entity, [], limit=limit, count="none")
+        objects = [row[0] for row in rows]
+    fetched = time.perf_counter()
+
+    body = envelope.model_validate(
+        {"message": "list", "data": objects, "pagination": pagination}, from_attributes=True
+    ).model_dump_json()
+    return fetched - started, time.perf_counter() - fetched, len(body)
+
+
+async def core_path(entity, item, envelope, limit: int):
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        rows, pagination = await fetch_page(
+            db, entity, [], limit=limit, count="none", fields=schema_columns(entity, item)
+        )
+    fetched = time.perf_counter()
+
+    body = records_response("list", rows, item, pagination).body
+    return fetched - started, time.perf_counter() - fetched, len(body)
+
+
+async def measure(path, entity, item, envelope, limit: int, iterations: int):
+    # Warm up: pool connections, compiled cache, prepared statements
+    for _ in range(3):
+        await path(entity, item, envelope, limit)
+
+    fetch = serialize = 0.0
+    for _ in range(iterations):
+        f, s, size = await path(entity, item, envelope, limit)
+        fetch += f
+        serialize += s
+    return fetch / iterations * 1000, serialize / iterations * 1000, size
+
+
+async def main(iterations: int):
+    print(f"List read paths, mean of {iterations} requests (ms: fetch + serialize = total)")
+    print("=====================================")
+
+    for label, entity, item, envelope in LISTS:
+        print(f" {label}")
+        for limit in PAGE_SIZES:
+            results = {}
+            for name, path in (("orm", orm_path), ("core", core_path)):
+                results[name] = await measure(path, entity, item, envelope, limit, iterations)
+
+            for name, (fetch, serialize, size) in results.items():
+                print(f"   limit={limit:<4} {name:5} {fetch:7.2f} + {serialize:6.2f} = "
+                      f"{fetch + serialize:7.2f} ms  ({size:,} bytes)")
+
+            orm_total = sum(results["orm"][:2])
+            core_total = sum(results["core"][:2])
+            print(f"   limit={limit:<4} core is {orm_total / core_total:4.1f}x faster")
+        print("=====================================")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    asyncio.run(main(iterations))
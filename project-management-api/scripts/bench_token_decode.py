@@ -0,0 +1,55 @@
+"""
+Access-token decode cost per request.
+
+Compares a plain `jose.jwt.decode` (what get_current_user used to do on
+every request) with TokenVerifier, cold (LRU miss) and warm (LRU hit).
+
+Usage:
+    python -m scripts.bench_token_decode [iterations]
+"""
+import sys
+import time
+from uuid import uuid4
+
+from jose import jwt
+
+from app.utils.auth import create_access_token
+from app.utils.tokens import TokenVerifier, build_token_verifier
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    token = create_access_token({"user_id": str(uuid4()), "session_id": str(uuid4())})
+    verifier = build_token_verifier()
+    key = verifier._keys[jwt.get_unverified_header(token)["kid"]]
+
+    raw = per_call_us(
+        lambda: jwt.decode(token, key, algorithms=[verifier.algorithm], options={"verify_exp": False}),
+        iterations,
+    )
+
+    cold_verifier = TokenVerifier(
+        algorithm=verifier.algorithm,
+        keys=verifier._keys,
+        active_kid=verifier.active_kid,
+        cache_size=0,
+    )
+    cold = per_call_us(lambda: cold_verifier.verify(token), iterations)
+
+    verifier.verify(token)
+    warm = per_call_us(lambda: verifier.verify(token), iterations)
+
+    print(f"Access-token decode ({verifier.algorithm}, {iterations:,} iterations)")
+    print("=====================================")
+    print(f" jose.jwt.decode:          {raw:8.2f} µs/request")
+    print(f" TokenVerifier (miss):     {cold:8.2f} µs/request")
+    print(f" TokenVerifier (LRU hit):  {warm:8.2f} µs/request")
+    print(f" speedup on hit:           {raw / warm:8.1f}x")
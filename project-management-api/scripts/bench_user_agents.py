@@ -0,0 +1,113 @@
+"""
+User-agent classification cost per login.
+
+Compares the old lowercase + substring chain with the rule-table parser,
+cold (LRU cleared before every call) and warm (LRU hit), over a corpus
+of common agents. Also prints how each one is classified.
+
+Usage:
+    python -m scripts.bench_user_agents [iterations]
+"""
+import sys
+import time
+
+from app.utils.device import parse_user_agent
+
+
+CORPUS = [
+    # Desktop browsers
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 Edg/129.0.2792.65",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 OPR/114.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:131.0) Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.0 Safari/605.1.15",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:131.0) Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (X11; CrOS x86_64 14541.0.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    # Mobile / tablet
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.6 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) CriOS/129.0.6668.69 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (iPad; CPU OS 17_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.6 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.6668.81 Mobile Safari/537.36",
+    "Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) SamsungBrowser/26.0 Chrome/122.0.0.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (Linux; Android 13; SM-X710) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Android 14; Mobile; rv:131.0) Gecko/131.0 Firefox/131.0",
+    # Bots and API clients
+    "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+    "Mozilla/5.0 (compatible; bingbot/2.0; +http://www.bing.com/bingbot.htm)",
+    "curl/8.5.0",
+    "PostmanRuntime/7.42.0",
+    "python-requests/2.32.3",
+    "python-httpx/0.27.2",
+    "",
+]
+
+
+def legacy_classify(ua: str) -> str:
+    """The substring chain extract_device_info used before the rule table."""
+    ua = (ua or "unknown").lower()
+
+    if "windows" in ua:
+        os = "Windows"
+    elif "macintosh" in ua or "mac os" in ua or "macos" in ua:
+        os = "macOS"
+    elif "iphone" in ua or "ipad" in ua:
+        os = "iOS"
+    elif "android" in ua:
+        os = "Android"
+    elif "linux" in ua:
+        os = "Linux"
+    else:
+        os = "Unknown"
+
+    if "chrome" in ua and "safari" in ua:
+        device = "Chrome"
+    elif "safari" in ua and "chrome" not in ua:
+        device = "Safari"
+    elif "firefox" in ua:
+        device = "Firefox"
+    elif "edg" in ua or "edge" in ua:
+        device = "Edge"
+    elif "curl" in ua:
+        device = "Curl"
+    else:
+        device = "Browser"
+
+    return f"{device} on {os}"
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(CORPUS[i % len(CORPUS)])
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def cold_parse(ua: str):
+    parse_user_agent.cache_clear()
+    return parse_user_agent(ua)
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    legacy = per_call_us(legacy_classify, iterations)
+    cold = per_call_us(cold_parse, iterations)
+
+    parse_user_agent.cache_clear()
+    warm = per_call_us(parse_user_agent, iterations)
+
+    print(f"User-agent classification ({len(CORPUS)} agents, {iterations:,} iterations)")
+    print("=====================================")
+    print(f" substring chain:          {legacy:8.2f} µs/login")
+    print(f" rule table (miss):        {cold:8.2f} µs/login")
+    print(f" rule table (LRU hit):     {warm:8.2f} µs/login")
+    print(f" cache: {parse_user_agent.cache_info()}")
+    print()
+    print("Classification")
+    print("=====================================")
+    for ua in CORPUS:
+        info = parse_user_agent(ua)
+        new = f"{info.browser} {info.browser_version} on {info.os} {info.os_version}".replace("  ", " ")
+        print(f" {legacy_classify(ua):22} -> {new:40} [{info.device_class}]")
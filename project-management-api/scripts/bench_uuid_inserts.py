@@ -0,0 +1,106 @@
+"""
+Primary-key insert throughput: random UUIDv4 vs time-ordered UUIDv7.
+
+Fills two scratch tables (uuid primary key + a task-sized payload) in
+batches, one id generator each, and prints the insert rate as the table
+grows, the WAL written and the final primary-key index size. The tables
+are dropped afterwards.
+
+Usage:
+    python -m scripts.bench_uuid_inserts [rows] [batch]
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.utils.ids import uuid7
+
+
+GENERATORS = [("uuid4", uuid.uuid4), ("uuid7", uuid7)]
+
+# Report the rate over each tenth of the run
+CHECKPOINTS = 10
+
+CREATE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id uuid PRIMARY KEY,
+        title varchar(255) NOT NULL,
+        created_at timestamptz NOT NULL DEFAULT now()
+    )
+"""
+
+INSERT = """
+    INSERT INTO {table} (id, title)
+    SELECT id, 'Bench task ' || ord
+    FROM unnest(CAST(:ids AS uuid[])) WITH ORDINALITY AS t(id, ord)
+"""
+
+
+async def _wal_lsn(conn):
+    return await conn.scalar(text("SELECT pg_current_wal_lsn()"))
+
+
+async def run(label: str, generate, rows: int, batch: int):
+    table = f"bench_pk_{label}"
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await conn.execute(text(CREATE.format(table=table)))
+
+    step = max(rows // CHECKPOINTS, batch)
+    inserted = 0
+    started = window_started = time.perf_counter()
+    window_rows = 0
+
+    async with engine.connect() as conn:
+        wal_start = await _wal_lsn(conn)
+
+        while inserted < rows:
+            n = min(batch, rows - inserted)
+            ids = [generate() for _ in range(n)]
+            await conn.execute(text(INSERT.format(table=table)), {"ids": ids})
+            await conn.commit()
+
+            inserted += n
+            window_rows += n
+            if window_rows >= step or inserted == rows:
+                elapsed = time.perf_counter() - window_started
+                print(f"   {inserted:>12,} rows  {window_rows / elapsed:>10,.0f} rows/s")
+                window_started, window_rows = time.perf_counter(), 0
+
+        total = time.perf_counter() - started
+        wal = await conn.scalar(
+            text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), CAST(:start AS pg_lsn))"),
+            {"start": str(wal_start)},
+        )
+        index_size = await conn.scalar(
+            text("SELECT pg_size_pretty(pg_relation_size(CAST(:index AS regclass)))"),
+            {"index": f"{table}_pkey"},
+        )
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+    print(f" {label}: {rows / total:,.0f} rows/s overall, "
+          f"WAL {int(wal) / 1024 ** 2:,.0f} MiB, pkey {index_size}")
+    print("=====================================")
+
+
+async def main(rows: int, batch: int):
+    print(f"Inserting {rows:,} rows per generator, {batch:,} per statement")
+    print("=====================================")
+    for label, generate in GENERATORS:
+        print(f" {label}")
+        await run(label, generate, rows, batch)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    rows, batch = args + [10_000_000, 10_000][len(args):]
+    asyncio.run(main(rows, batch))
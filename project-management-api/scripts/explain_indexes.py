@@ -0,0 +1,104 @@
+"""
+EXPLAIN the list / board / scope queries against the seeded benchmark
+dataset (see scripts.seed_benchmark_data) and report which index each uses.
+
+Usage:
+    python -m scripts.explain_indexes [--analyze]
+"""
+import asyncio
+import json
+import sys
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import engine
+from app.models.project import Project
+from app.models.session import Session
+from app.models.task import Task
+from app.models.user import User
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _sample_ids(conn) -> dict:
+    manager = await conn.scalar(
+        select(Project.owner_id).group_by(Project.owner_id).order_by(func.count().desc()).limit(1)
+    )
+    developer = await conn.scalar(
+        select(Task.assigned_to).where(Task.assigned_to.is_not(None))
+        .group_by(Task.assigned_to).order_by(func.count().desc()).limit(1)
+    )
+    project = await conn.scalar(
+        select(Task.project_id).group_by(Task.project_id).order_by(func.count().desc()).limit(1)
+    )
+    session_user = await conn.scalar(
+        select(Session.user_id).group_by(Session.user_id).order_by(func.count().desc()).limit(1)
+    )
+    return {"manager": manager, "developer": developer, "project": project, "session_user": session_user}
+
+
+def _queries(ids: dict) -> list:
+    newest_tasks = select(Task).order_by(Task.created_at.desc()).limit(20)
+    newest_projects = select(Project).order_by(Project.created_at.desc()).limit(20)
+    newest_sessions = select(Session).order_by(Session.created_at.desc()).limit(20)
+
+    return [
+        ("list_tasks (admin)", newest_tasks),
+        ("list_tasks project_id=", newest_tasks.where(Task.project_id == ids["project"])),
+        ("list_tasks status=", newest_tasks.where(Task.status == "review")),
+        ("list_tasks (manager scope)", newest_tasks.where(Task.project_id.in_(
+            select(Project.id).where(Project.owner_id == ids["manager"]).scalar_subquery()
+        ))),
+        ("list_tasks (developer scope)", newest_tasks.where(Task.assigned_to == ids["developer"])),
+        ("get_task_board / list_project_tasks", select(Task).where(Task.project_id == ids["project"])),
+        ("ensure_project_access (developer)", select(func.count()).select_from(Task)
+            .where(Task.project_id == ids["project"]).where(Task.assigned_to == ids["developer"])),
+        ("list_projects (admin)", newest_projects),
+        ("list_projects (manager scope)", newest_projects.where(Project.owner_id == ids["manager"])),
+        ("list_projects (developer scope)", newest_projects.where(Project.id.in_(
+            select(Task.project_id).where(Task.assigned_to == ids["developer"]).scalar_subquery()
+        ))),
+        ("list_sessions (admin, active)", newest_sessions.where(Session.is_active == True)),
+        ("list_sessions user_id=", newest_sessions.where(Session.user_id == ids["session_user"])
+            .where(Session.is_active == True)),
+        ("list_users (admin)", select(User).order_by(User.created_at.desc()).limit(20)),
+    ]
+
+
+async def main(analyze: bool):
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+
+    async with engine.connect() as conn:
+        ids = await _sample_ids(conn)
+
+        print(f"EXPLAIN ({options})")
+        print("=====================================")
+        for label, stmt in _queries(ids):
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            raw = await conn.scalar(text(f"EXPLAIN ({options}) {sql}"))
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+
+            nodes = list(_plan_nodes(plan["Plan"]))
+            indexes = sorted({n["Index Name"] for n in nodes if "Index Name" in n})
+            # Cheap seq scans (empty / tiny session partitions) are fine
+            seq_scans = sorted({
+                n["Relation Name"] for n in nodes
+                if n["Node Type"] == "Seq Scan" and n["Total Cost"] > 1000
+            })
+
+            mark = "✘" if seq_scans else "✔"
+            timing = f"{plan['Execution Time']:8.2f} ms" if analyze else f"cost {plan['Plan']['Total Cost']:>10.1f}"
+            print(f" {mark} {label:38} {timing}  {', '.join(indexes) or '-'}")
+            if seq_scans:
+                print(f"     seq scan on: {', '.join(seq_scans)}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(analyze="--analyze" in sys.argv[1:]))
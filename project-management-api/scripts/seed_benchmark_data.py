@@ -0,0 +1,124 @@
+"""
+Seed a benchmark dataset (bench*@example.com users, their projects, tasks
+and sessions) with set-based INSERT ... SELECT generate_series.
+
+Every seeded user has the password "password123".
+
+Usage:
+    python -m scripts.seed_benchmark_data [users] [projects] [tasks] [sessions]
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.utils.auth import hash_password
+
+
+USERS = """
+    INSERT INTO users (id, email, username, full_name, password_hash, role, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           'bench' || g || '@example.com',
+           'bench' || g,
+           'Bench User ' || g,
+           :password_hash,
+           (CASE WHEN g % 20 = 0 THEN 'manager' ELSE 'developer' END)::user_role,
+           true,
+           now() - random() * interval '365 days',
+           now()
+    FROM generate_series(1, :n) g
+    ON CONFLICT DO NOTHING
+"""
+
+PROJECTS = """
+    WITH managers AS (
+        SELECT array_agg(id) AS ids FROM users
+        WHERE role = 'manager' AND email LIKE 'bench%@example.com'
+    )
+    INSERT INTO projects (id, name, description, status, owner_id, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           'Bench project ' || g,
+           'Benchmark project number ' || g,
+           (ARRAY['planning', 'active', 'on_hold', 'completed'])[1 + g % 4]::project_status,
+           ids[1 + g % array_length(ids, 1)],
+           now() - random() * interval '365 days',
+           now()
+    FROM generate_series(1, :n) g, managers
+"""
+
+TASKS = """
+    WITH projects_ AS (
+        SELECT array_agg(id) AS ids FROM projects WHERE name LIKE 'Bench project %'
+    ), developers AS (
+        SELECT array_agg(id) AS ids FROM users
+        WHERE role = 'developer' AND email LIKE 'bench%@example.com'
+    )
+    INSERT INTO tasks (id, title, description, status, priority, project_id, assigned_to,
+                       created_by, due_date, estimated_hours, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           'Bench task ' || g,
+           'Benchmark task number ' || g,
+           (ARRAY['todo', 'in_progress', 'review', 'done'])[1 + g % 4]::task_status,
+           (ARRAY['low', 'medium', 'high', 'critical'])[1 + (g / 4) % 4]::task_priority,
+           p.ids[1 + (g * 7919) % array_length(p.ids, 1)],
+           CASE WHEN g % 10 = 0 THEN NULL ELSE d.ids[1 + (g * 104729) % array_length(d.ids, 1)] END,
+           d.ids[1 + g % array_length(d.ids, 1)],
+           now() + (random() * 120 - 60) * interval '1 day',
+           1 + g % 40,
+           now() - random() * interval '365 days',
+           now()
+    FROM generate_series(1, :n) g, projects_ p, developers d
+"""
+
+SESSIONS = """
+    WITH users_ AS (
+        SELECT array_agg(id) AS ids FROM users WHERE email LIKE 'bench%@example.com'
+    )
+    INSERT INTO sessions (id, user_id, refresh_token_hash, device_name, device_os, user_agent,
+                          ip_address, is_active, created_at, last_used_at, refresh_token_expires_at)
+    SELECT gen_random_uuid(),
+           u.ids[1 + (g * 7919) % array_length(u.ids, 1)],
+           'hmac-sha256$' || md5(g::text),
+           'Chrome on Windows',
+           'Windows',
+           'Mozilla/5.0 (bench)',
+           '10.0.' || (g % 256) || '.' || (g / 256 % 256),
+           g % 3 <> 0,
+           ts,
+           ts + random() * interval '1 day',
+           ts + interval '30 days'
+    FROM generate_series(1, :n) g, users_ u,
+         LATERAL (SELECT now() - random() * interval '60 days' AS ts) t
+"""
+
+
+async def seed(users: int, projects: int, tasks: int, sessions: int):
+    password_hash = hash_password("password123")
+
+    async with engine.begin() as conn:
+        for label, sql, n, params in (
+            ("users", USERS, users, {"password_hash": password_hash}),
+            ("projects", PROJECTS, projects, {}),
+            ("tasks", TASKS, tasks, {}),
+            ("sessions", SESSIONS, sessions, {}),
+        ):
+            started = time.perf_counter()
+            result = await conn.execute(text(sql), {"n": n, **params})
+            print(f" {label:10} {result.rowcount:>10,} rows  {time.perf_counter() - started:6.1f}s")
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE users, projects, tasks, sessions"))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    users, projects, tasks, sessions = args + [10_000, 2_000, 500_000, 200_000][len(args):]
+
+    print("Seeding benchmark dataset")
+    print("=====================================")
+    asyncio.run(seed(users, projects, tasks, sessions))
@@ -0,0 +1,92 @@
+"""
+InvalidationBus against a local Postgres: transactional delivery, origin
+filtering, and a flush on every (re)connect.
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.utils.invalidation_bus import InvalidationBus, invalidation_bus
+
+
+pytestmark = pytest.mark.asyncio
+
+TIMEOUT = 5
+
+
+@pytest_asyncio.fixture
+async def channel(db):
+    return f"test_invalidation_{uuid4().hex[:12]}"
+
+
+@pytest_asyncio.fixture
+async def listener(channel):
+    """A running bus on `channel` with its events / flushes recorded."""
+    bus = InvalidationBus(dsn=invalidation_bus.dsn, channel=channel, reconnect_delay=0.05)
+    bus.events = asyncio.Queue()
+    bus.flushed = asyncio.Event()
+
+    bus.subscribe("task", lambda entity_id, generation: bus.events.put_nowait((entity_id, generation)))
+    bus.on_flush(bus.flushed.set)
+
+    task = asyncio.create_task(bus.run())
+    await asyncio.wait_for(bus.flushed.wait(), TIMEOUT)
+    yield bus
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.fixture
+def publisher(channel):
+    # Another worker: a different origin on the same channel
+    return InvalidationBus(dsn=invalidation_bus.dsn, channel=channel)
+
+
+async def test_committed_event_is_delivered(db, listener, publisher):
+    entity_id = uuid4()
+    await publisher.publish(db, "task", entity_id, 42)
+    await db.commit()
+
+    assert await asyncio.wait_for(listener.events.get(), TIMEOUT) == (str(entity_id), 42)
+
+
+async def test_rolled_back_event_is_not_delivered(db, listener, publisher):
+    await publisher.publish(db, "task", uuid4(), 1)
+    await db.rollback()
+
+    committed = uuid4()
+    await publisher.publish(db, "task", committed, 2)
+    await db.commit()
+
+    assert await asyncio.wait_for(listener.events.get(), TIMEOUT) == (str(committed), 2)
+
+
+async def test_own_events_are_skipped(db, listener, publisher):
+    await listener.publish(db, "task", uuid4(), 1)
+    await db.commit()
+
+    other = uuid4()
+    await publisher.publish(db, "task", other, 2)
+    await db.commit()
+
+    assert await asyncio.wait_for(listener.events.get(), TIMEOUT) == (str(other), 2)
+    assert listener.events.empty()
+
+
+async def test_reconnect_flushes(db, listener, channel):
+    listener.flushed.clear()
+
+    await db.execute(text("""
+        SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+        WHERE query = 'LISTEN "' || :channel || '"'
+    """), {"channel": channel})
+    await db.commit()
+
+    await asyncio.wait_for(listener.flushed.wait(), TIMEOUT)
+    assert listener.reconnects >= 1
+    assert listener.flushes >= 2
@@ -0,0 +1,283 @@
+"""
+Keyset cursors (app/utils/pagination.py): the pure helpers, then whole
+walks over a seeded task list with ties on created_at, then which count
+strategy each count=exact|estimated|none request runs.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import insert, text
+
+from app.models.enums import ProjectStatus, TaskPriority, TaskStatus, UserRole
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.utils import pagination as pagination_module
+from app.utils.pagination import decode_cursor, encode_cursor, fetch_page, keyset_window
+
+
+T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _row(minutes: int):
+    return SimpleNamespace(id=uuid4(), created_at=T0 + timedelta(minutes=minutes))
+
+
+# ---------------------------------------------------------
+# CURSOR TOKENS / WINDOW (no database)
+# ---------------------------------------------------------
+def test_cursor_round_trip():
+    row_id = uuid4()
+    assert decode_cursor(encode_cursor(T0, row_id)) == (T0, row_id, False)
+    assert decode_cursor(encode_cursor(T0, row_id, backwards=True)) == (T0, row_id, True)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(T0, uuid4())[:-4]])
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_window_forward_first_page():
+    rows = [_row(-i) for i in range(3)]  # limit 2 + the extra row
+
+    page, next_cursor, prev_cursor, has_more = keyset_window(rows, 2, backwards=False, has_previous=False)
+
+    assert page == rows[:2]
+    assert has_more is True
+    assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id, False)
+    assert prev_cursor is None
+
+
+def test_window_forward_last_page():
+    rows = [_row(-i) for i in range(2)]
+
+    page, next_cursor, prev_cursor, has_more = keyset_window(rows, 2, backwards=False, has_previous=True)
+
+    assert page == rows
+    assert (next_cursor, has_more) == (None, False)
+    assert decode_cursor(prev_cursor) == (rows[0].created_at, rows[0].id, True)
+
+
+def test_window_backwards_restores_newest_first():
+    # A "before" query returns ascending rows, plus the extra one
+    rows = [_row(i) for i in range(3)]
+
+    page, next_cursor, prev_cursor, has_more = keyset_window(rows, 2, backwards=True, has_previous=False)
+
+    assert page == [rows[1], rows[0]]
+    assert has_more is True
+    assert decode_cursor(next_cursor)[:2] == (rows[0].created_at, rows[0].id)
+    assert decode_cursor(prev_cursor)[:2] == (rows[1].created_at, rows[1].id)
+
+
+def test_window_backwards_reaching_the_start():
+    rows = [_row(i) for i in range(2)]
+
+    page, _, prev_cursor, _ = keyset_window(rows, 2, backwards=True, has_previous=False)
+
+    assert page == [rows[1], rows[0]]
+    assert prev_cursor is None
+
+
+# ---------------------------------------------------------
+# WALKS OVER A SEEDED LIST (database)
+# ---------------------------------------------------------
+FIELDS = (Task.id, Task.created_at)
+
+
+@pytest_asyncio.fixture
+async def project(db):
+    owner = (await db.scalars(insert(User).values(
+        email=f"{uuid4().hex}@example.com", username=uuid4().hex, full_name="Pager",
+        password_hash="x", role=UserRole.admin, is_active=True,
+    ).returning(User))).one()
+    project = (await db.scalars(insert(Project).values(
+        name="Paged", status=ProjectStatus.active, owner_id=owner.id,
+    ).returning(Project))).one()
+    await db.commit()
+    return project
+
+
+async def _seed(db, project, minutes: list[int]) -> list[tuple]:
+    """Tasks created at T0 + each offset; returns their (created_at, id) newest first."""
+    rows = [
+        {
+            "id": uuid4(), "title": f"Task {i}", "status": TaskStatus.todo, "priority": TaskPriority.low,
+            "project_id": project.id, "created_by": project.owner_id,
+            "created_at": T0 + timedelta(minutes=offset),
+        }
+        for i, offset in enumerate(minutes)
+    ]
+    await db.execute(insert(Task), rows)
+    await db.commit()
+    return sorted(((row["created_at"], row["id"]) for row in rows), reverse=True)
+
+
+def _ids(keys) -> list:
+    return [row_id for _, row_id in keys]
+
+
+@pytest.fixture
+def tied():
+    # Three rows share one created_at: only the id tiebreak orders them
+    return [0, 5, 5, 5, 10, 15, 20]
+
+
+async def _page(db, project, **kwargs):
+    rows, pagination = await fetch_page(
+        db, Task, [Task.project_id == project.id], fields=FIELDS, count="none", **kwargs
+    )
+    return [row.id for row in rows], pagination
+
+
+@pytest.mark.asyncio
+async def test_forward_walk_visits_every_row_once(db, project, tied):
+    expected = _ids(await _seed(db, project, tied))
+
+    seen, cursor = [], None
+    while True:
+        ids, pagination = await _page(db, project, limit=2, cursor=cursor)
+        seen += ids
+        cursor = pagination["next_cursor"]
+        assert pagination["has_more"] == (cursor is not None)
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_backward_walk_from_the_last_page(db, project, tied):
+    expected = _ids(await _seed(db, project, tied))
+
+    # Forward to the last page, then follow prev_cursor back to the start
+    pages, cursor = [], None
+    while True:
+        ids, pagination = await _page(db, project, limit=2, cursor=cursor)
+        pages.append(ids)
+        if pagination["next_cursor"] is None:
+            break
+        cursor = pagination["next_cursor"]
+
+    back, prev_cursor = [pages[-1]], pagination["prev_cursor"]
+    while prev_cursor:
+        ids, pagination = await _page(db, project, limit=2, cursor=prev_cursor)
+        back.insert(0, ids)
+        # Walking back, there is always a page after this one
+        assert pagination["next_cursor"] is not None
+        prev_cursor = pagination["prev_cursor"]
+
+    assert back == pages
+    assert [i for ids in back for i in ids] == expected
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_stable_across_inserts(db, project, tied):
+    keys = await _seed(db, project, tied)
+
+    first, pagination = await _page(db, project, limit=3)
+    # A row newer than the whole page, and one tied with the page's last row
+    added = await _seed(db, project, [30, 10])
+    second, _ = await _page(db, project, limit=3, cursor=pagination["next_cursor"])
+
+    boundary = keys[2]
+    assert first == _ids(keys[:3])
+    assert second == _ids([key for key in sorted(keys + added, reverse=True) if key < boundary][:3])
+
+
+# ---------------------------------------------------------
+# COUNT MODES
+# ---------------------------------------------------------
+def _counted(sent) -> tuple[int, bool]:
+    """(statements sent, whether the page query carried the window count)."""
+    return len(sent), any("OVER ()" in statement for statement in sent)
+
+
+@pytest.mark.asyncio
+async def test_exact_count_filtered_uses_the_window(db, project, tied, statements):
+    await _seed(db, project, tied)
+    statements.clear()
+
+    _, pagination = await fetch_page(db, Task, [Task.project_id == project.id], limit=2, fields=FIELDS)
+
+    assert _counted(statements) == (1, True)
+    assert (pagination["total"], pagination["pages"], pagination["has_more"]) == (7, 4, True)
+
+
+@pytest.mark.asyncio
+async def test_exact_count_unfiltered_runs_a_separate_count(db, project, tied, statements):
+    await _seed(db, project, tied)
+    statements.clear()
+
+    _, pagination = await fetch_page(db, Task, [], limit=2, fields=FIELDS)
+
+    assert _counted(statements) == (2, False)
+    assert pagination["total"] == 7
+
+
+@pytest.mark.asyncio
+async def test_exact_count_with_cursor_runs_a_separate_count(db, project, tied, statements):
+    await _seed(db, project, tied)
+    _, first = await _page(db, project, limit=2)
+    statements.clear()
+
+    _, pagination = await fetch_page(
+        db, Task, [Task.project_id == project.id], limit=2, cursor=first["next_cursor"], fields=FIELDS
+    )
+
+    assert _counted(statements) == (2, False)
+    assert pagination["total"] == 7
+
+
+@pytest.mark.asyncio
+async def test_exact_count_past_the_last_page(db, project, tied, statements):
+    await _seed(db, project, tied)
+    statements.clear()
+
+    rows, pagination = await fetch_page(db, Task, [Task.project_id == project.id], page=5, limit=2, fields=FIELDS)
+
+    # The window saw no rows, so a COUNT follows
+    assert rows == []
+    assert _counted(statements) == (2, True)
+    assert (pagination["total"], pagination["has_more"]) == (7, False)
+
+
+@pytest.mark.asyncio
+async def test_count_none(db, project, tied, statements):
+    await _seed(db, project, tied)
+    statements.clear()
+
+    _, pagination = await fetch_page(db, Task, [Task.project_id == project.id], limit=2, count="none", fields=FIELDS)
+
+    assert _counted(statements) == (1, False)
+    assert (pagination["total"], pagination["pages"], pagination["has_more"]) == (None, None, True)
+    assert (pagination["count"], pagination["estimated"]) == ("none", False)
+
+
+@pytest.mark.asyncio
+async def test_count_estimated_filtered_is_capped(db, project, tied, monkeypatch):
+    await _seed(db, project, tied)
+    monkeypatch.setattr(pagination_module.settings, "COUNT_ESTIMATE_CAP", 5)
+
+    _, pagination = await fetch_page(
+        db, Task, [Task.project_id == project.id], limit=2, count="estimated", fields=FIELDS
+    )
+
+    assert (pagination["total"], pagination["capped"], pagination["estimated"]) == (5, True, True)
+
+
+@pytest.mark.asyncio
+async def test_count_estimated_unfiltered_reads_planner_stats(db, project, tied):
+    await _seed(db, project, tied)
+    await db.execute(text("ANALYZE tasks"))
+    await db.commit()
+
+    _, pagination = await fetch_page(db, Task, [], limit=2, count="estimated", fields=FIELDS)
+
+    assert (pagination["total"], pagination["capped"], pagination["estimated"]) == (7, False, True)
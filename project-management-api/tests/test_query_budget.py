@@ -0,0 +1,30 @@
+"""
+Per-request query budgets (app/utils/query_budget.py): only the request's
+own statements count, not the SET LOCAL that applies its timeout.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.utils.query_budget import QueryBudget
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_set_local_is_not_counted(db, statements):
+    budget = QueryBudget("GET /test", statement_timeout_ms=1000, max_queries=0, max_ms=0)
+
+    # Bound to one connection, so the budget stays attached between transactions
+    async with engine.connect() as conn:
+        session = AsyncSession(bind=conn)
+        session.sync_session.info["query_budget"] = budget
+        for _ in range(3):
+            await session.execute(text("SELECT 1"))
+            await session.commit()
+        await session.close()
+
+    # One SET LOCAL per transaction was sent, none of them counted
+    assert sum("statement_timeout" in statement for statement in statements) == 3
+    assert budget.queries == 3
@@ -0,0 +1,65 @@
+"""SessionReaper against Postgres: batch budgets and startup partitions."""
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from app.utils.session_reaper import SessionReaper, _add_months
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _user(db):
+    user_id = uuid4()
+    await db.execute(text("""
+        INSERT INTO users (id, email, username, full_name, password_hash, role, is_active)
+        VALUES (:id, :email, :username, 'Reaper', 'x', 'developer', true)
+    """), {"id": user_id, "email": f"{user_id.hex}@example.com", "username": user_id.hex})
+    return user_id
+
+
+def _days(n: int) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=n)
+
+
+async def _session(db, user_id, expires_in: int, last_used: int = 0, is_active: bool = True):
+    await db.execute(text("""
+        INSERT INTO sessions (id, user_id, refresh_token_hash, is_active, refresh_token_expires_at, last_used_at)
+        VALUES (:id, :user_id, 'x', :is_active, :expires_at, :last_used_at)
+    """), {
+        "id": uuid4(), "user_id": user_id, "is_active": is_active,
+        "expires_at": _days(expires_in), "last_used_at": _days(last_used),
+    })
+
+
+async def _session_count(db, where: str) -> int:
+    return await db.scalar(text(f"SELECT count(*) FROM sessions WHERE {where}"))
+
+
+async def test_expired_backlog_does_not_starve_inactive_pass(db):
+    user_id = await _user(db)
+    for _ in range(3):
+        await _session(db, user_id, expires_in=-40)
+    await _session(db, user_id, expires_in=10, last_used=-40, is_active=False)
+    await _session(db, user_id, expires_in=10)
+    await db.commit()
+
+    reaper = SessionReaper(batch_size=1, max_batches=1)
+    await reaper.run_once()
+
+    assert await _session_count(db, "is_active IS NOT TRUE") == 0
+    assert await _session_count(db, "refresh_token_expires_at < now()") == 2
+    assert await _session_count(db, "true") == 3
+
+
+async def test_ensure_partitions_recreates_missing_month(db):
+    month = _add_months(date.today().replace(day=1), 1)
+    name = f"sessions_p{month:%Y%m}"
+    await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    await db.commit()
+
+    await SessionReaper().ensure_partitions()
+
+    assert await db.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
@@ -0,0 +1,225 @@
+"""
+Statements per write request, end to end through the HTTP routes.
+
+Every SQL statement the request sends is counted (SELECTs included), with
+a cold principal cache so the two auth lookups (session, user) are part of
+every authenticated count. The writes themselves are one INSERT / UPDATE
+... RETURNING each (app/utils/writes.py): no follow-up refresh SELECT.
+"""
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+
+from app.main import create_app
+from app.models.enums import ProjectStatus, TaskPriority, TaskStatus, UserRole
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.services import session_service
+from app.services.auth_service import AuthService
+from app.services.session_service import SessionService
+from app.services.task_service import TaskService
+from app.utils.auth import hash_password
+from app.utils.principal_cache import principal_cache
+
+
+pytestmark = pytest.mark.asyncio
+
+PASSWORD = "round-trip-password"
+
+# Session row + user row, on a cold principal cache
+AUTH = ["SELECT sessions", "SELECT users"]
+
+
+def _shape(statement: str) -> str:
+    """'SELECT users', 'UPDATE tasks', ...: verb plus the first table named."""
+    words = statement.replace("\n", " ").split()
+    verb = words[0].upper()
+    marker = {"SELECT": "FROM", "INSERT": "INTO", "UPDATE": None, "DELETE": "FROM"}.get(verb)
+    index = words.index(marker) + 1 if marker in words else 1
+    return f"{verb} {words[index].lstrip('(').split('(')[0].split('.')[0]}"
+
+
+# ---------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------
+@pytest_asyncio.fixture
+async def client(db):
+    async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def no_session_cap(monkeypatch):
+    # The cap adds a lock + eviction UPDATE; see test_login_over_cap
+    monkeypatch.setattr(session_service.settings, "MAX_ACTIVE_SESSIONS_PER_USER", 0)
+
+
+async def _user(db, role: UserRole) -> User:
+    user = (await db.scalars(insert(User).values(
+        email=f"{uuid4().hex}@example.com", username=uuid4().hex, full_name=role.value,
+        password_hash=hash_password(PASSWORD), role=role, is_active=True,
+    ).returning(User))).one()
+    await db.commit()
+    return user
+
+
+async def _bearer(db, user: User) -> dict:
+    session = await SessionService.create_session(db, user.id, refresh_token=str(uuid4()))
+    token = AuthService.issue_access_token(user.id, session.id, role=user.role)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def admin(db):
+    user = await _user(db, UserRole.admin)
+    user.headers = await _bearer(db, user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def manager(db):
+    user = await _user(db, UserRole.manager)
+    user.headers = await _bearer(db, user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def project(db, manager):
+    project = (await db.scalars(insert(Project).values(
+        name="Project", status=ProjectStatus.active, owner_id=manager.id,
+    ).returning(Project))).one()
+    await db.commit()
+    return project
+
+
+@pytest_asyncio.fixture
+async def task(db, manager, project):
+    task = (await db.scalars(insert(Task).values(
+        title="Task", status=TaskStatus.todo, priority=TaskPriority.low,
+        project_id=project.id, created_by=manager.id,
+    ).returning(Task))).one()
+    await db.commit()
+    return task
+
+
+async def _send(client, statements, method: str, url: str, **kwargs):
+    principal_cache.clear()
+    statements.clear()
+    response = await client.request(method, url, **kwargs)
+    return response, [_shape(statement) for statement in statements]
+
+
+# ---------------------------------------------------------
+# PROJECTS
+# ---------------------------------------------------------
+async def test_create_project(client, manager, statements):
+    response, sent = await _send(
+        client, statements, "POST", "/api/v1/projects/",
+        json={"name": "New", "status": "planning"}, headers=manager.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert sent == AUTH + ["INSERT projects"]
+
+
+async def test_update_project(client, manager, project, statements):
+    response, sent = await _send(
+        client, statements, "PUT", f"/api/v1/projects/{project.id}",
+        json={"name": "Renamed"}, headers=manager.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["name"] == "Renamed"
+    # Ownership check, then the write
+    assert sent == AUTH + ["SELECT projects", "UPDATE projects"]
+
+
+# ---------------------------------------------------------
+# TASKS
+# ---------------------------------------------------------
+async def test_create_task(client, admin, project, statements):
+    response, sent = await _send(
+        client, statements, "POST", "/api/v1/tasks/",
+        json={"title": "New", "status": "todo", "priority": "high", "project_id": str(project.id)},
+        headers=admin.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert sent == AUTH + ["INSERT tasks"]
+
+
+async def test_update_task(client, manager, task, statements):
+    response, sent = await _send(
+        client, statements, "PATCH", f"/api/v1/tasks/{task.id}",
+        json={"title": "Renamed"}, headers=manager.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["title"] == "Renamed"
+    # The manager's project scope rides along in the UPDATE
+    assert sent == AUTH + ["UPDATE tasks"]
+
+
+async def test_update_status(client, manager, task, statements):
+    response, sent = await _send(
+        client, statements, "PATCH", f"/api/v1/tasks/{task.id}/status",
+        json={"status": "done"}, headers=manager.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["status"] == "done"
+    assert sent == AUTH + ["UPDATE tasks"]
+
+
+async def test_delete_task(client, manager, task, statements):
+    response, sent = await _send(
+        client, statements, "DELETE", f"/api/v1/tasks/{task.id}", headers=manager.headers,
+    )
+    assert response.status_code == 200, response.text
+    assert sent == AUTH + ["DELETE tasks"]
+
+
+@pytest.mark.parametrize("missing, status_code", [(True, 404), (False, 403)])
+async def test_developer_delete_is_404_before_403(db, task, missing, status_code):
+    developer = await _user(db, UserRole.developer)
+
+    with pytest.raises(HTTPException) as exc:
+        await TaskService.delete_task(db, uuid4() if missing else task.id, developer)
+    assert exc.value.status_code == status_code
+
+
+# ---------------------------------------------------------
+# SESSIONS
+# ---------------------------------------------------------
+async def test_login(client, admin, statements):
+    response, sent = await _send(
+        client, statements, "POST", "/api/v1/auth/login",
+        data={"username": admin.email, "password": PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+    # User (single lookup), then create_session's INSERT
+    assert sent == ["SELECT users", "INSERT sessions"]
+
+
+async def test_login_over_cap(client, admin, statements, monkeypatch):
+    monkeypatch.setattr(session_service.settings, "MAX_ACTIVE_SESSIONS_PER_USER", 5)
+    response, sent = await _send(
+        client, statements, "POST", "/api/v1/auth/login",
+        data={"username": admin.email, "password": PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+    # Per-user advisory lock and the eviction UPDATE come with the cap
+    assert sent == ["SELECT users", "SELECT pg_advisory_xact_lock", "UPDATE sessions", "INSERT sessions"]
+
+
+async def test_refresh(client, db, admin, statements):
+    refresh_token = str(uuid4())
+    session = await SessionService.create_session(db, admin.id, refresh_token=refresh_token)
+
+    response, sent = await _send(
+        client, statements, "POST", "/api/v1/auth/refresh",
+        json={"session_id": str(session.id), "refresh_token": refresh_token},
+    )
+    assert response.status_code == 200, response.text
+    # Session lookup, then rotate_refresh_token's conditional UPDATE
+    assert sent == ["SELECT sessions", "UPDATE sessions"]